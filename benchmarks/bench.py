@@ -0,0 +1,200 @@
+"""Benchmark every scheduler and page replacement policy on seeded workloads.
+
+    python benchmarks/bench.py                   # 10^2 .. 10^6 items, compare with baseline.json
+    python benchmarks/bench.py --save            # ... and make this run the new baseline
+    python benchmarks/bench.py --max-size 10000 --only LRU --only FCFS
+
+Each benchmark reports the best wall time over a few runs, the tracemalloc peak
+of one extra run, and items (processes or references) per second. The scaling
+exponent is the least-squares slope of log(CPU time) against log(items); a run
+warns when a CPU time or exponent is worse than the baseline's by more than the
+given tolerance.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ossim import MEMORY_ALGORITHMS, SCHEDULERS, generate_workload, run_scheduler, working_set_references
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Timings this short vary by half again between processes; they are reported
+# but never fitted or compared
+NOISE_FLOOR = 0.01
+# Short benchmarks repeat until they have run for MIN_TIME and keep the best
+# run; long ones stop repeating once they have used REPEAT_BUDGET
+MIN_TIME = 0.25
+REPEAT_BUDGET = 2.0
+
+
+def make_workload(n, seed):
+    # Arrivals outpace the CPU so the ready queue keeps growing
+    return generate_workload(n, seed, rate=0.5, mean_burst=10)
+
+
+def make_trace(n, frames, seed):
+    # A working set twice the size of memory in an address space 64 times it
+    return array('q', working_set_references(n, 64 * frames, seed, set_size=2 * frames))
+
+
+def measure(run, memory=True):
+    # Best wall and CPU time; the CPU time is what gets compared, since other
+    # load on the machine stretches wall time without the code getting slower
+    best, best_cpu, spent, runs = math.inf, math.inf, 0.0, 0
+    gc.collect()
+    while runs == 0 or (spent < REPEAT_BUDGET and (runs < 3 or spent < MIN_TIME)):
+        start, start_cpu = time.perf_counter(), time.process_time()
+        run()
+        elapsed = time.perf_counter() - start
+        best, best_cpu = min(best, elapsed), min(best_cpu, time.process_time() - start_cpu)
+        spent, runs = spent + elapsed, runs + 1
+    peak = None
+    if memory:
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, best_cpu, peak
+
+
+def scaling_exponent(sizes):
+    # sizes maps item count -> seconds
+    points = [(math.log(n), math.log(t)) for n, t in sizes.items() if t >= NOISE_FLOOR]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    if not sxx:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+
+def benchmarks(args):
+    # (name, build(n), run(data)) for every selected algorithm
+    cases = [(f"schedule/{algo}", lambda n: make_workload(n, args.seed),
+              lambda table, algo=algo: run_scheduler(table, algo, args.quantum))
+             for algo in SCHEDULERS]
+    cases += [(f"paging/{algo}", lambda n: make_trace(n, args.frames, args.seed),
+               lambda pages, fn=fn: fn(pages, args.frames, args.record))
+              for algo, fn in MEMORY_ALGORITHMS.items()]
+    if args.only:
+        cases = [case for case in cases if any(word.lower() in case[0].lower() for word in args.only)]
+    return cases
+
+
+def run_suite(args):
+    cases = benchmarks(args)
+    if not cases:
+        raise ValueError("No benchmark matches --only.")
+    results = {name: {"sizes": {}} for name, _, _ in cases}
+    print(f"{'benchmark':<36}{'items':>10}{'seconds':>12}{'items/s':>14}{'peak MiB':>10}")
+    for n in args.sizes:
+        data = {}
+        for name, build, run in cases:
+            # Schedulers share one workload and policies one trace per size
+            kind = name.split("/")[0]
+            if kind not in data:
+                data[kind] = build(n)
+            seconds, cpu_seconds, peak = measure(lambda: run(data[kind]), not args.no_memory)
+            entry = {"seconds": seconds, "cpu_seconds": cpu_seconds,
+                     "items_per_sec": n / seconds if seconds else None, "peak_bytes": peak}
+            results[name]["sizes"][str(n)] = entry
+            mib = f"{peak / 2 ** 20:10.2f}" if peak is not None else f"{'-':>10}"
+            print(f"{name:<36}{n:>10}{seconds:>12.4f}{n / max(seconds, 1e-9):>14.0f}{mib}", flush=True)
+    for entry in results.values():
+        entry["exponent"] = scaling_exponent({int(n): s["cpu_seconds"] for n, s in entry["sizes"].items()})
+    return {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                     "seed": args.seed, "frames": args.frames, "quantum": args.quantum, "record": args.record},
+            "results": results}
+
+
+def compare(report, baseline, time_tolerance, exponent_tolerance):
+    """Warnings for every timing or scaling exponent worse than the baseline's."""
+    warnings = []
+    for name, entry in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        common = [n for n in entry["sizes"] if n in base["sizes"]]
+        for n in common:
+            now, before = entry["sizes"][n]["cpu_seconds"], base["sizes"][n]["cpu_seconds"]
+            if min(now, before) >= NOISE_FLOOR and now > before * (1 + time_tolerance):
+                warnings.append(f"{name} at {n} items: {now:.4f}s CPU vs baseline {before:.4f}s "
+                                f"({now / before:.2f}x slower)")
+        # Fit both runs over the same sizes so a different --sizes cannot move the slope
+        now = scaling_exponent({int(n): entry["sizes"][n]["cpu_seconds"] for n in common})
+        before = scaling_exponent({int(n): base["sizes"][n]["cpu_seconds"] for n in common})
+        if now is not None and before is not None and now > before + exponent_tolerance:
+            warnings.append(f"{name}: scaling exponent {now:.2f} vs baseline {before:.2f}")
+    return warnings
+
+
+def parse_sizes(text):
+    sizes = sorted({int(float(part)) for part in text.split(",") if part.strip()})
+    if not sizes or sizes[0] <= 0:
+        raise argparse.ArgumentTypeError("sizes must be positive numbers, e.g. 100,1e4,1e6")
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the schedulers and page replacement policies.")
+    parser.add_argument("--sizes", type=parse_sizes, default=[10 ** k for k in range(2, 7)],
+                        help="comma-separated item counts (default: 1e2,1e3,1e4,1e5,1e6)")
+    parser.add_argument("--max-size", type=int, help="drop sizes above this")
+    parser.add_argument("--only", action="append", help="run benchmarks whose name contains this; repeatable")
+    parser.add_argument("--seed", type=int, default=1, help="workload and trace seed (default: 1)")
+    parser.add_argument("--frames", type=int, default=64, help="page frames (default: 64)")
+    parser.add_argument("--quantum", type=int, default=2, help="Round Robin / MLFQ quantum (default: 2)")
+    parser.add_argument("--record", choices=("full", "faults", "none"), default="full",
+                        help="page history kept by the policies (default: full)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file (default: %(default)s)")
+    parser.add_argument("--save", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="warn when slower than baseline by this fraction (default: 0.25)")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.15,
+                        help="warn when the scaling exponent grows by more than this (default: 0.15)")
+    args = parser.parse_args(argv)
+    if args.max_size:
+        args.sizes = [n for n in args.sizes if n <= args.max_size]
+    if not args.sizes or args.frames <= 0 or args.quantum <= 0:
+        parser.error("sizes, --frames and --quantum must be positive")
+
+    try:
+        report = run_suite(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        if baseline.get("meta", {}).get("platform") != report["meta"]["platform"]:
+            print(f"note: baseline was recorded on {baseline.get('meta', {}).get('platform')}", file=sys.stderr)
+        warnings = compare(report, baseline, args.tolerance, args.exponent_tolerance)
+        for warning in warnings:
+            print(f"WARNING: {warning}", file=sys.stderr)
+        if not warnings:
+            print(f"No regressions against {args.baseline}.", file=sys.stderr)
+    elif not args.save:
+        print(f"No baseline at {args.baseline}; run with --save to record one.", file=sys.stderr)
+
+    if args.save:
+        with open(args.baseline, "w") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+        print(f"Saved baseline to {args.baseline}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,212 +1,47 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import copy
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib import cm
-from matplotlib.animation import FuncAnimation
-
-# I. ALGORITHM IMPLEMENTATIONS 
-
-def fcfs_scheduling(processes):
-    processes.sort(key=lambda x: x['arrival'])
-    time, gantt = 0, []
-    for p in processes:
-        if time < p['arrival']:
-            time = p['arrival']
-        start, finish = time, time + p['burst']
-        gantt.append((p['pid'], start, finish))
-        time += p['burst']
-        p['waiting'] = start - p['arrival']
-        p['turnaround'] = finish - p['arrival']
-    return gantt, processes
-
-
-def sjf_scheduling(processes):
-    processes.sort(key=lambda x: x['arrival'])
-    completed, time, gantt = [], 0, []
-    while len(completed) < len(processes):
-        ready = [p for p in processes if p not in completed and p['arrival'] <= time]
-        if not ready:
-            if [p for p in processes if p not in completed]:
-                time += 1
-            else:
-                break
-            continue
-        p = min(ready, key=lambda x: x['burst'])
-        start, finish = time, time + p['burst']
-        gantt.append((p['pid'], start, finish))
-        time = finish
-        p['waiting'] = start - p['arrival']
-        p['turnaround'] = finish - p['arrival']
-        completed.append(p)
-    return gantt, processes
-
-
-def priority_scheduling(processes):
-    processes.sort(key=lambda x: x['arrival'])
-    completed, time, gantt = [], 0, []
-    while len(completed) < len(processes):
-        ready = [p for p in processes if p not in completed and p['arrival'] <= time]
-        if not ready:
-            if [p for p in processes if p not in completed]:
-                time += 1
-            else:
-                break
-            continue
-        p = min(ready, key=lambda x: x['priority'])
-        start, finish = time, time + p['burst']
-        gantt.append((p['pid'], start, finish))
-        time = finish
-        p['waiting'] = start - p['arrival']
-        p['turnaround'] = finish - p['arrival']
-        completed.append(p)
-    return gantt, processes
-
-
-def round_robin(processes, quantum):
-    working = sorted(copy.deepcopy(processes), key=lambda x: x['arrival'])
-    for p in working:
-        p['remaining_burst'] = p['burst']
-        p['wait_time'] = 0
-        p['turn_time'] = 0
-        p['last_run'] = p['arrival']
-    
-    time, gantt, completed = 0, [], 0
-    ready_queue = []
-    
-    # Track original processes by PID for final metrics calculation
-    orig_procs_map = {p['pid']: p for p in working}
-    
-    # Store dynamic process state
-    dynamic_procs = {p['pid']: p for p in working}
-    
-    while completed < len(working):
-        # Add newly arrived processes to ready queue
-        i = 0
-        while i < len(working):
-            p = working[i]
-            if p['arrival'] <= time and p['remaining_burst'] > 0 and p not in ready_queue:
-                ready_queue.append(p)
-                working.pop(i) 
-            else:
-                i += 1
-
-        if not ready_queue:
-            # Find the next process arrival time to jump to
-            next_arrival = min([p['arrival'] for p in working if p['remaining_burst'] > 0], default=None)
-            if next_arrival is not None:
-                time = next_arrival
-                continue
-            else: 
-                # No more processes left
-                break
-        
-        p = ready_queue.pop(0)
-        run_time = min(quantum, p['remaining_burst'])
-        start = time
-        time += run_time
-        
-        p['remaining_burst'] -= run_time
-        gantt.append((p['pid'], start, time))
-        
-        # Add processes that arrive during the execution of 'p'
-        i = 0
-        while i < len(working):
-            proc_i = working[i]
-            if proc_i['arrival'] <= time and proc_i['remaining_burst'] > 0 and proc_i not in ready_queue:
-                ready_queue.append(proc_i)
-                working.pop(i)
-            else:
-                i += 1
-        
-        if p['remaining_burst'] > 0:
-            ready_queue.append(p)
-        else:
-            p['turn_time'] = time - p['arrival']
-            p['wait_time'] = p['turn_time'] - p['burst']
-            completed += 1
-            
-    final_procs = []
-    for orig_p in processes:
-        # Find all execution segments for the process
-        completion_time = max([end for pid, start, end in gantt if pid == orig_p['pid']], default=0)
-        turnaround = completion_time - orig_p['arrival']
-        waiting = turnaround - orig_p['burst']
-
-        p_copy = copy.deepcopy(orig_p)
-        p_copy['waiting'] = waiting
-        p_copy['turnaround'] = turnaround
-        final_procs.append(p_copy)
-        
-    return gantt, final_procs
-
-
-def fifo_page_replacement(pages, frames):
-    memory, faults, history = [], 0, []
-    for page in pages:
-        is_fault = False
-        if page not in memory:
-            faults += 1
-            is_fault = True
-            if len(memory) < frames:
-                memory.append(page)
-            else:
-                memory.pop(0)
-                memory.append(page)
-        history.append((page, list(memory), is_fault))
-    return faults, history
-
-
-def lru_page_replacement(pages, frames):
-    memory, faults, history = [], 0, []
-    recent = [] 
-    for page in pages:
-        is_fault = False
-        if page not in memory:
-            faults += 1
-            is_fault = True
-            if len(memory) < frames:
-                memory.append(page)
-                recent.append(page)
-            else:
-                lru_page = recent.pop(0)
-                victim_index = memory.index(lru_page)
-                memory[victim_index] = page
-                recent.append(page)
-        else:
-            recent.remove(page)
-            recent.append(page)
-            
-        history.append((page, list(memory), is_fault))
-    return faults, history
-
-
-def optimal_page_replacement(pages, frames):
-    memory, faults, history = [], 0, []
-    for i, page in enumerate(pages):
-        is_fault = False
-        if page not in memory:
-            faults += 1
-            is_fault = True
-            if len(memory) < frames:
-                memory.append(page)
-            else:
-                future = pages[i + 1:]
-                indices = []
-                for m in memory:
-                    try:
-                        indices.append(future.index(m))
-                    except ValueError:
-                        indices.append(float('inf'))
-                
-                victim = indices.index(max(indices))
-                memory[victim] = page
-                
-        history.append((page, list(memory), is_fault))
-    return faults, history
+from operator import itemgetter
+from tkinter import ttk, messagebox, filedialog
+
+# I. ALGORITHM IMPLEMENTATIONS
+# The scheduling and page replacement algorithms live in the GUI-free ossim
+# package so batch jobs can use them without Tk or matplotlib.
+from ossim import (
+    MEMORY_ALGORITHMS, MULTICORE_ENGINES, SCHEDULERS,
+    FaultCurveSweep, LazyGantt, PageTrace, PolicyComparison, QuantumSweep, SchedulerComparison,
+    belady_anomalies, best_quantum, gantt_end,
+    iter_references, parse_quanta, parse_workload,
+)
+
+# Longer reference strings are summarised instead of animated step by step
+ANIMATE_MAX_REFERENCES = 2000
+# Gantt charts with more slices are drawn all at once, with level of detail,
+# instead of being replayed
+ANIMATE_MAX_SLICES = 2000
+# The Gantt legend stops after this many processes; the colours repeat after 20
+LEGEND_MAX_PIDS = 20
+# The fault curve stops at this many frames, or at the simulated frame count if
+# that is larger: the Optimal pass costs O(references x frames)
+FAULT_CURVE_MAX_FRAMES = 64
+# The results table lists this many processes, in arrival order, and notes how
+# many more there are; the averages still cover every process
+TABLE_MAX_ROWS = 500
+
+# matplotlib and its TkAgg backend take about a second to import, so they are
+# loaded when the first chart window opens rather than at startup. NumPy comes
+# along with it, since matplotlib depends on it.
+matplotlib = plt = FigureCanvasTkAgg = NavigationToolbar2Tk = np = None
+
+
+def load_matplotlib():
+    global matplotlib, plt, FigureCanvasTkAgg, NavigationToolbar2Tk, np
+    if plt is None:
+        import matplotlib as mpl
+        mpl.use('TkAgg')
+        import matplotlib.pyplot as pyplot
+        import numpy
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as canvas_class
+        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk as toolbar_class
+        matplotlib, plt, FigureCanvasTkAgg, NavigationToolbar2Tk, np = mpl, pyplot, canvas_class, toolbar_class, numpy
 
 
 # II. ANIMATED PROGRESS INDICATOR
@@ -260,7 +95,8 @@ class MemoryTraceAnimator:
     def __init__(self, output_widget, history, pages, frames, algo, root_after_ref):
         self.output = output_widget
         self.history = history
-        self.pages = pages
+        # A copy, since a trace's pages become unreadable once it is closed
+        self.pages = list(pages)
         self.frames = frames
         self.algo = algo
         self.root_after = root_after_ref
@@ -290,7 +126,7 @@ class MemoryTraceAnimator:
         self.output.insert(tk.END, "="*70 + "\n", 'header')
         self.output.insert(tk.END, f"🎯 {self.algo} PAGE REPLACEMENT ALGORITHM (ANIMATED TRACE)\n", 'title')
         self.output.insert(tk.END, "="*70 + "\n", 'header')
-        self.output.insert(tk.END, f"📄 Reference String: {self.pages}\n", 'info')
+        self.output.insert(tk.END, f"📄 Reference String: {list(self.pages)}\n", 'info')
         self.output.insert(tk.END, f"🗂️  Number of Frames: {self.frames}\n", 'info')
         self.output.insert(tk.END, "="*70 + "\n\n", 'header')
         
@@ -334,7 +170,7 @@ class MemoryTraceAnimator:
 
     def show_final_metrics(self):
         total_pages = len(self.pages)
-        total_faults = sum(1 for _, _, fault in self.history if fault)
+        total_faults = self.history.fault_count()
         
         # Ensure final line is not highlighted
         self.output.tag_remove('current_step', '1.0', tk.END)
@@ -345,7 +181,109 @@ class MemoryTraceAnimator:
         self.output.insert(tk.END, "="*70 + "\n", 'footer')
 
 
-# IV. GUI INTEGRATION 
+# IV. Level-of-detail Gantt rendering for charts too big to animate
+
+def gantt_arrays(gantt, pid_codes):
+    """Merged slices of one gantt as NumPy arrays (lane, start, end, code).
+
+    Back-to-back slices of the same process on the same lane become one, and
+    the result is sorted by lane, then start. pid_codes maps each pid to an
+    integer code and gains an entry for every pid it has not seen.
+    """
+    if isinstance(gantt, LazyGantt):
+        codes = np.array([pid_codes.setdefault(pid, len(pid_codes)) for pid in gantt.pids], dtype=np.int64)
+        code = codes[np.asarray(gantt.rows, dtype=np.int64)]
+        start = np.asarray(gantt.start, dtype=np.int64)
+        end = np.asarray(gantt.finish, dtype=np.int64)
+        lane = np.zeros(len(gantt), dtype=np.int64)
+    else:
+        # Entries are (pid, start, end), plus the core on multi-core runs
+        def column(k):
+            return np.fromiter(map(itemgetter(k), gantt), dtype=np.int64, count=len(gantt))
+
+        pids = list(map(itemgetter(0), gantt))
+        for pid in dict.fromkeys(pids):
+            pid_codes.setdefault(pid, len(pid_codes))
+        code = np.fromiter(map(pid_codes.__getitem__, pids), dtype=np.int64, count=len(pids))
+        start, end = column(1), column(2)
+        lane = column(3) if len(gantt) and len(gantt[0]) > 3 else np.zeros(len(gantt), dtype=np.int64)
+
+    order = np.lexsort((start, lane))
+    lane, start, end, code = lane[order], start[order], end[order], code[order]
+    if not len(lane):
+        return lane, start, end, code
+    new = np.ones(len(lane), dtype=bool)
+    new[1:] = (lane[1:] != lane[:-1]) | (code[1:] != code[:-1]) | (start[1:] != end[:-1])
+    first = np.flatnonzero(new)
+    last = np.append(first[1:] - 1, len(lane) - 1)
+    return lane[first], start[first], end[last], code[first]
+
+
+class GanttDetail:
+    """All bars of one Gantt axis in a single PolyCollection.
+
+    refresh() rebuilds the collection from the slices in view only. When there
+    are more of them than pixel columns it keeps the first slice starting in
+    each column plus every slice at least a pixel wide, so the cost follows the
+    axis width rather than the slice count; zooming in brings the detail back.
+    PID labels are drawn only on bars wide enough to hold them.
+    """
+
+    def __init__(self, ax, lane, start, end, code, palette, pids):
+        self.ax, self.palette, self.pids = ax, palette, pids
+        # Rough width of a bold 9 pt label in pixels, plus some padding
+        self.label_px = np.array([7.5 * len(pid) + 6 for pid in pids])
+        self.dark_text = palette[:, :3].sum(axis=1) > 1.5
+        self.lanes = []
+        for value in (np.unique(lane) if len(lane) else [0]):
+            rows = lane == value
+            self.lanes.append((int(value) * 6, start[rows], end[rows], code[rows]))
+        self.bars = matplotlib.collections.PolyCollection([], edgecolors='white')
+        ax.add_collection(self.bars, autolim=False)
+        self.labels = []
+
+    def refresh(self):
+        x0, x1 = self.ax.get_xlim()
+        width = max(self.ax.bbox.width, 1)
+        unit = (x1 - x0) / width  # time units per pixel
+
+        parts = []
+        for y, start, end, code in self.lanes:
+            i0, i1 = np.searchsorted(end, x0, 'right'), np.searchsorted(start, x1, 'left')
+            s, e, c = start[i0:i1], end[i0:i1], code[i0:i1]
+            if len(s) > width:
+                column = (s - x0) // unit
+                keep = np.empty(len(s), dtype=bool)
+                keep[0] = True
+                np.not_equal(column[1:], column[:-1], out=keep[1:])
+                keep |= (e - s) >= unit
+                s, e, c = s[keep], e[keep], c[keep]
+            parts.append((np.full(len(s), y), s, e, c))
+        y, s, e, c = (np.concatenate(arrays) for arrays in zip(*parts))
+
+        # Thinned slices still cover at least one pixel
+        right = np.maximum(e, s + unit)
+        verts = np.empty((len(s), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = s
+        verts[:, 2, 0] = verts[:, 3, 0] = right
+        verts[:, 0, 1] = verts[:, 3, 1] = y
+        verts[:, 1, 1] = verts[:, 2, 1] = y + 5
+        self.bars.set_verts(verts)
+        self.bars.set_facecolor(self.palette[c % len(self.palette)])
+        # Outlines would swamp bars only a few pixels wide
+        self.bars.set_linewidth(np.where(e - s >= 4 * unit, 1.5, 0))
+
+        for label in self.labels:
+            label.remove()
+        left, visible_right = np.maximum(s, x0), np.minimum(e, x1)
+        fits = visible_right - left >= self.label_px[c] * unit
+        self.labels = [self.ax.text((a + b) / 2, lane + 2.5, self.pids[k], ha='center', va='center',
+                                    color='black' if self.dark_text[k % len(self.palette)] else 'white',
+                                    fontsize=9, fontweight='bold')
+                       for a, b, lane, k in zip(left[fits], visible_right[fits], y[fits], c[fits])]
+
+
+# V. GUI INTEGRATION 
 
 class OSSimulator:
     def __init__(self, root):
@@ -364,6 +302,13 @@ class OSSimulator:
         # Internal state for the animator
         self.animator = None
         self.MemoryTraceAnimator = MemoryTraceAnimator
+        # Binary trace loaded from disk, referenced from the entry as "trace:<path>"
+        self.trace = None
+        # Scheduler comparison in progress and the inputs it was started with
+        self.cpu_job = self.cpu_run = None
+        self.sweep_job = self.sweep_run = None
+        self.curve_job = self.curve_run = None
+        self.compare_job = None
 
         self.setup_styles()
         self.create_widgets()
@@ -448,7 +393,7 @@ class OSSimulator:
         left_frame.pack(side='left', fill='both', expand=True)
         
         ttk.Label(left_frame, text="Select Algorithm:", font=("Calibri", 11)).grid(row=0, column=0, sticky="w", padx=5, pady=8)
-        self.cpu_algo = ttk.Combobox(left_frame, values=["FCFS", "SJF", "Priority", "Round Robin"], 
+        self.cpu_algo = ttk.Combobox(left_frame, values=["FCFS", "SJF", "SRTF", "Priority", "Priority (Preemptive)", "Round Robin", "MLFQ"], 
                                      style="TCombobox", state="readonly", width=22, font=("Consolas", 11))
         self.cpu_algo.set("SJF")
         self.cpu_algo.grid(row=0, column=1, padx=10, pady=8, sticky="w")
@@ -457,6 +402,27 @@ class OSSimulator:
         self.quantum_entry = ttk.Entry(left_frame, style="TEntry", width=10, font=("Consolas", 11))
         self.quantum_entry.insert(0, "2")
         self.quantum_entry.grid(row=1, column=1, padx=10, pady=8, sticky="w")
+
+        ttk.Label(left_frame, text="MLFQ Boost Interval (0 = off):", font=("Calibri", 11)).grid(row=2, column=0, sticky="w", padx=5, pady=8)
+        self.boost_entry = ttk.Entry(left_frame, style="TEntry", width=10, font=("Consolas", 11))
+        self.boost_entry.insert(0, "0")
+        self.boost_entry.grid(row=2, column=1, padx=10, pady=8, sticky="w")
+
+        ttk.Label(left_frame, text="CPU Cores:", font=("Calibri", 11)).grid(row=0, column=2, sticky="w", padx=(25, 5), pady=8)
+        self.cores_entry = ttk.Entry(left_frame, style="TEntry", width=10, font=("Consolas", 11))
+        self.cores_entry.insert(0, "1")
+        self.cores_entry.grid(row=0, column=3, padx=10, pady=8, sticky="w")
+
+        ttk.Label(left_frame, text="Multi-core Dispatch:", font=("Calibri", 11)).grid(row=1, column=2, sticky="w", padx=(25, 5), pady=8)
+        self.dispatch_mode = ttk.Combobox(left_frame, values=["Global Queue", "Per-Core Queues"],
+                                          style="TCombobox", state="readonly", width=16, font=("Consolas", 11))
+        self.dispatch_mode.set("Global Queue")
+        self.dispatch_mode.grid(row=1, column=3, padx=10, pady=8, sticky="w")
+
+        ttk.Label(left_frame, text="RR Quantum Sweep:", font=("Calibri", 11)).grid(row=2, column=2, sticky="w", padx=(25, 5), pady=8)
+        self.sweep_entry = ttk.Entry(left_frame, style="TEntry", width=10, font=("Consolas", 11))
+        self.sweep_entry.insert(0, "1-10")
+        self.sweep_entry.grid(row=2, column=3, padx=10, pady=8, sticky="w")
         
         # Right side - Standard Run button
         right_frame = tk.Frame(settings_grid, bg=self.DARK_NAVY)
@@ -472,6 +438,17 @@ class OSSimulator:
                                      activebackground='#60B0FF',
                                      activeforeground=self.TEXT_DARK)
         self.run_cpu_btn.pack(pady=10)
+
+        self.sweep_btn = tk.Button(right_frame, text="🔁 QUANTUM SWEEP",
+                                   command=self.run_quantum_sweep,
+                                   bg=self.MID_BLUE, fg=self.TEXT_LIGHT,
+                                   font=("Calibri", 11, "bold"),
+                                   width=18,
+                                   relief="raised", bd=3,
+                                   cursor="hand2",
+                                   activebackground=self.ACCENT_BLUE,
+                                   activeforeground=self.TEXT_DARK)
+        self.sweep_btn.pack(pady=(0, 10))
         
         # Progress indicator
         self.cpu_progress = AnimatedProgress(algo_fr, width=500)
@@ -503,13 +480,10 @@ class OSSimulator:
                              wraplength=700)
         info_label.pack(pady=8)
         
-        self.figure = plt.Figure(figsize=(9, 2.5), facecolor=self.DARK_NAVY)
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor(self.DARK_NAVY)
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        self.canvas = FigureCanvasTkAgg(self.figure, master=gantt_fr)
-        self.canvas.get_tk_widget().pack(fill="both", expand=1)
+        # Plain placeholder: building a matplotlib canvas here would load
+        # matplotlib before the main window could appear
+        self.gantt_preview = tk.Frame(gantt_fr, bg=self.DARK_NAVY, height=250)
+        self.gantt_preview.pack(fill="both", expand=1)
 
     def build_mem_tab(self):
         frame = ttk.Frame(self.mem_tab, padding=15, style="TFrame")
@@ -528,6 +502,15 @@ class OSSimulator:
         self.ref_entry = ttk.Entry(input_fr, style="TEntry", width=40, font=("Consolas", 11))
         self.ref_entry.insert(0, "7,0,1,2,0,3,0,4,2,3,0,3,2,1,2,0,1,7,0,1")
         self.ref_entry.pack(side='left', padx=(5, 5), pady=5)
+
+        self.load_trace_btn = tk.Button(input_fr, text="📂 LOAD TRACE", command=self.load_trace,
+                                        bg=self.MID_BLUE, fg=self.TEXT_LIGHT,
+                                        font=("Calibri", 10, "bold"),
+                                        relief="raised", bd=2,
+                                        cursor="hand2",
+                                        activebackground=self.ACCENT_BLUE,
+                                        activeforeground=self.TEXT_DARK)
+        self.load_trace_btn.pack(side='left', padx=(0, 5))
         
         ttk.Label(input_fr, text="Frames:", font=("Calibri", 11)).pack(side='left', padx=(10, 0))
         self.frame_entry = ttk.Entry(input_fr, style="TEntry", width=5, font=("Consolas", 11))
@@ -545,7 +528,7 @@ class OSSimulator:
         left_frame.pack(side='left', fill='both', expand=True)
         
         ttk.Label(left_frame, text="Select Algorithm:", font=("Calibri", 11)).pack(side='left', padx=5)
-        self.mem_algo = ttk.Combobox(left_frame, values=["FIFO", "LRU", "Optimal"], 
+        self.mem_algo = ttk.Combobox(left_frame, values=list(MEMORY_ALGORITHMS), 
                                      style="TCombobox", state="readonly", width=18, font=("Consolas", 11))
         self.mem_algo.set("LRU")
         self.mem_algo.pack(side='left', padx=10)
@@ -563,6 +546,28 @@ class OSSimulator:
                                      activebackground='#FF8787',
                                      activeforeground='#FFFFFF')
         self.run_mem_btn.pack()
+
+        self.curve_btn = tk.Button(right_frame, text="📉 FAULT CURVE",
+                                   command=self.show_fault_curve,
+                                   bg=self.ACCENT_BLUE, fg=self.TEXT_DARK,
+                                   font=("Calibri", 11, "bold"),
+                                   width=25,
+                                   relief="raised", bd=3,
+                                   cursor="hand2",
+                                   activebackground='#60B0FF',
+                                   activeforeground=self.TEXT_DARK)
+        self.curve_btn.pack(pady=(6, 0))
+
+        self.compare_mem_btn = tk.Button(right_frame, text="📊 COMPARE ALL POLICIES",
+                                         command=self.compare_memory_policies,
+                                         bg=self.ACCENT_BLUE, fg=self.TEXT_DARK,
+                                         font=("Calibri", 11, "bold"),
+                                         width=25,
+                                         relief="raised", bd=3,
+                                         cursor="hand2",
+                                         activebackground='#60B0FF',
+                                         activeforeground=self.TEXT_DARK)
+        self.compare_mem_btn.pack(pady=(6, 0))
         
         # Progress indicator
         self.mem_progress = AnimatedProgress(algo_fr, width=500)
@@ -584,10 +589,10 @@ class OSSimulator:
         scrollbar.config(command=self.memory_output.yview)
     
     # --- Helper functions ---
-    def compute_avg_metrics(self, procs):
-        n = len(procs)
-        total_wait = sum(p.get('waiting', 0) for p in procs)
-        total_turn = sum(p.get('turnaround', 0) for p in procs)
+    def compute_avg_metrics(self, waiting, turnaround):
+        n = len(waiting)
+        total_wait = sum(waiting)
+        total_turn = sum(turnaround)
         avg_wait = total_wait / n if n else 0
         avg_turn = total_turn / n if n else 0
         return avg_wait, avg_turn
@@ -600,77 +605,184 @@ class OSSimulator:
         self.root.after(500, self._execute_cpu)
     
     def _execute_cpu(self):
-        try:
-            self.run_cpu()
-        finally:
-            self.cpu_progress.stop_animation()
-            self.run_cpu_btn.config(state='normal')
+        # run_cpu hands back control while the comparison is still running;
+        # _poll_cpu_job ends the progress animation once it completes
+        if not self.run_cpu():
+            self._finish_cpu_run()
+
+    def _finish_cpu_run(self):
+        self.cpu_progress.stop_animation()
+        self.run_cpu_btn.config(state='normal')
+
+    def read_process_table(self):
+        text = self.process_text.get("1.0", "end-1c").strip().splitlines()
+        if not text:
+            raise ValueError("Please enter processes.")
+
+        return parse_workload(text)
 
     def run_cpu(self):
         try:
-            text = self.process_text.get("1.0", "end-1c").strip().splitlines()
-            if not text:
-                raise ValueError("Please enter processes.")
-            
-            base_processes = []
-            for line in text:
-                parts = line.split()
-                if len(parts) < 3:
-                    raise ValueError("Each line must have PID Arrival Burst [Priority].")
-                pid, arr, burst = parts[0], int(parts[1]), int(parts[2])
-                priority = int(parts[3]) if len(parts) > 3 else 1
-                base_processes.append({'pid': pid, 'arrival': arr, 'burst': burst, 'orig_burst': burst, 'priority': priority})
-                
-            if not base_processes:
-                 raise ValueError("No valid processes entered.")
-
+            table = self.read_process_table()
             chosen_algo = self.cpu_algo.get()
             quantum = int(self.quantum_entry.get()) if self.quantum_entry.get().isdigit() and int(self.quantum_entry.get()) > 0 else 2
+            boost = int(self.boost_entry.get()) if self.boost_entry.get().isdigit() else 0
+
+            cores = int(self.cores_entry.get()) if self.cores_entry.get().isdigit() and int(self.cores_entry.get()) > 0 else 1
+            dispatch = "global"
+            if cores > 1:
+                if chosen_algo not in MULTICORE_ENGINES:
+                    raise ValueError(f"{chosen_algo} runs on a single core only; set CPU Cores to 1.")
+                dispatch = "per-core" if self.dispatch_mode.get() == "Per-Core Queues" else "global"
+                algos = list(MULTICORE_ENGINES)
+            else:
+                algos = list(SCHEDULERS)
 
-            # Execute all algorithms for comparison
-            procs_fcfs = copy.deepcopy(base_processes)
-            gantt_fcfs, procs_fcfs = fcfs_scheduling(procs_fcfs)
-
-            procs_sjf = copy.deepcopy(base_processes)
-            gantt_sjf, procs_sjf = sjf_scheduling(procs_sjf)
+            # Every engine reads the same table, so no per-algorithm copies are
+            # needed; big tables run in worker processes over shared memory
+            self.cpu_job = SchedulerComparison(table, algos, quantum, boost, cores, dispatch)
+            self.cpu_run = {"table": table, "algos": algos, "chosen": chosen_algo,
+                            "quantum": quantum, "results": {}}
+            self._poll_cpu_job()
+            return True
 
-            procs_prio = copy.deepcopy(base_processes)
-            gantt_prio, procs_prio = priority_scheduling(procs_prio)
+        except Exception as e:
+            messagebox.showerror("CPU Scheduling Error", str(e))
+            return False
 
-            procs_rr = copy.deepcopy(base_processes)
-            gantt_rr, procs_rr = round_robin(procs_rr, quantum)
+    def _poll_cpu_job(self):
+        # Merge finished algorithms into the results as they arrive, showing the
+        # chosen one straight away and the comparison once all are in
+        job, run = self.cpu_job, self.cpu_run
+        try:
+            for algo, result in job.poll():
+                run["results"][algo] = self._result_entry(*result)
+                if algo == run["chosen"]:
+                    chosen = run["results"][algo]
+                    self.display_cpu_results(chosen['gantt'], run["table"], chosen['waiting'],
+                                             chosen['turnaround'], algo)
+            if not job.done():
+                self.root.after(20, self._poll_cpu_job)
+                return
+            job.close()
+            all_results = {algo: run["results"][algo] for algo in run["algos"]}
+            self.show_comparative_gantt_animated(all_results, run["quantum"])
+        except Exception as e:
+            job.close()
+            messagebox.showerror("CPU Scheduling Error", str(e))
+        self.cpu_job = None
+        self._finish_cpu_run()
 
-            all_results = {
-                "FCFS": {"gantt": gantt_fcfs, "procs": procs_fcfs, "avg": self.compute_avg_metrics(procs_fcfs)},
-                "SJF": {"gantt": gantt_sjf, "procs": procs_sjf, "avg": self.compute_avg_metrics(procs_sjf)},
-                "Priority": {"gantt": gantt_prio, "procs": procs_prio, "avg": self.compute_avg_metrics(procs_prio)},
-                "Round Robin": {"gantt": gantt_rr, "procs": procs_rr, "avg": self.compute_avg_metrics(procs_rr)},
-            }
+    def _result_entry(self, gantt, waiting, turnaround):
+        return {"gantt": gantt, "waiting": waiting, "turnaround": turnaround,
+                "avg": self.compute_avg_metrics(waiting, turnaround)}
 
-            chosen_key = chosen_algo
-            self.display_cpu_results(all_results[chosen_key]['gantt'], all_results[chosen_key]['procs'], chosen_key)
-            self.show_comparative_gantt_animated(all_results, quantum)
+    def run_quantum_sweep(self):
+        """Sweep the RR quantum over the entered range and plot each metric"""
+        try:
+            table = self.read_process_table()
+            # Quanta run as separate jobs while the window stays responsive;
+            # _poll_sweep_job merges them as they finish
+            self.sweep_job = QuantumSweep(table, parse_quanta(self.sweep_entry.get()))
+        except Exception as e:
+            messagebox.showerror("CPU Scheduling Error", str(e))
+            return
+        self.sweep_run = {"processes": len(table), "results": {}}
+        self.cpu_progress.start_animation()
+        self.sweep_btn.config(state='disabled')
+        # Let the button and progress bar repaint before the first quantum runs
+        self.root.after(20, self._poll_sweep_job)
 
+    def _poll_sweep_job(self):
+        job, run = self.sweep_job, self.sweep_run
+        try:
+            finished = job.poll()
+            run["results"].update(finished)
+            if finished:
+                self.summary_label.delete(1.0, tk.END)
+                self.summary_label.insert(tk.END, f"🔁 Round Robin Quantum Sweep: {len(run['results'])} of "
+                                                  f"{len(job.quanta)} quanta done\n", 'title')
+            if not job.done():
+                self.root.after(20, self._poll_sweep_job)
+                return
+            self.show_quantum_sweep(run["processes"], [run["results"][q] for q in job.quanta])
         except Exception as e:
             messagebox.showerror("CPU Scheduling Error", str(e))
+        job.close()
+        self.sweep_job = None
+        self.cpu_progress.stop_animation()
+        self.sweep_btn.config(state='normal')
 
-    def display_cpu_results(self, gantt, procs, algo):
+    def show_quantum_sweep(self, processes, sweep):
+        best = best_quantum(sweep)
+        self.summary_label.delete(1.0, tk.END)
+        self.summary_label.insert(tk.END, f"🔁 Round Robin Quantum Sweep ({processes} processes)\n", 'title')
+        self.summary_label.insert(tk.END, f"{'='*60}\n")
+        self.summary_label.insert(tk.END, f"{'Quantum':>8}{'Avg Wait':>12}{'Avg TAT':>12}{'Avg Resp':>12}{'Switches':>10}\n", 'metric')
+        for entry in sweep:
+            line = (f"{entry['quantum']:>8}{entry['avg_waiting']:>12.2f}{entry['avg_turnaround']:>12.2f}"
+                    f"{entry['avg_response']:>12.2f}{entry['context_switches']:>10}\n")
+            self.summary_label.insert(tk.END, line, 'best' if entry is best else 'metric')
+        self.summary_label.insert(tk.END, f"{'='*60}\n")
+        self.summary_label.insert(tk.END, f"🏆 Best quantum (lowest average waiting time): {best['quantum']}\n", 'best')
+        self.summary_label.tag_config('title', foreground='#41A0FF', font=('Consolas', 11, 'bold'))
+        self.summary_label.tag_config('metric', foreground='#E0FBFC', font=('Consolas', 10))
+        self.summary_label.tag_config('best', foreground='#51CF66', font=('Consolas', 10, 'bold'))
+
+        load_matplotlib()
+        win = tk.Toplevel(self.root)
+        win.title("🔁 Round Robin Quantum Sweep")
+        win.configure(bg=self.DARK_NAVY)
+        win.geometry("1000x700")
+
+        fig, axes = plt.subplots(2, 2, figsize=(10, 7), facecolor=self.DARK_NAVY)
+        quanta = [entry["quantum"] for entry in sweep]
+        panels = (("avg_waiting", "Average Waiting Time", '#41A0FF'),
+                  ("avg_turnaround", "Average Turnaround Time", '#51CF66'),
+                  ("avg_response", "Average Response Time", '#FFB84D'),
+                  ("context_switches", "Context Switches", '#FF6B6B'))
+        for ax, (metric, label, color) in zip(axes.flat, panels):
+            ax.set_facecolor(self.DARK_NAVY)
+            ax.plot(quanta, [entry[metric] for entry in sweep], marker='o', markersize=4, color=color, linewidth=2)
+            ax.axvline(best["quantum"], color='#FFD700', linestyle='--', linewidth=1.2, alpha=0.8)
+            ax.scatter([best["quantum"]], [best[metric]], s=90, color='#FFD700', zorder=3)
+            ax.set_title(label, color=self.TEXT_LIGHT, fontsize=11, fontweight='bold')
+            ax.set_xlabel('Time Quantum', color=self.TEXT_LIGHT, fontsize=9)
+            ax.tick_params(colors=self.TEXT_LIGHT)
+            ax.grid(True, alpha=0.2, color=self.TEXT_LIGHT)
+        fig.suptitle(f"Best quantum: {best['quantum']} (avg waiting {best['avg_waiting']:.2f})",
+                     color='#FFD700', fontsize=12, fontweight='bold')
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+
+        def on_close():
+            plt.close(fig)
+            win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", on_close)
+
+    def display_cpu_results(self, gantt, table, waiting, turnaround, algo):
         for item in self.tree.get_children():
             self.tree.delete(item)
             
-        for p in procs:
-            priority = p.get('priority', 1)
-            self.tree.insert("", "end", values=(p['pid'], p['arrival'], p['burst'], priority, f"{p['waiting']:.2f}", f"{p['turnaround']:.2f}"))
+        for p in table.to_dicts(waiting, turnaround, rows=table.arrival_order()[:TABLE_MAX_ROWS]):
+            self.tree.insert("", "end", values=(p['pid'], p['arrival'], p['burst'], p['priority'], f"{p['waiting']:.2f}", f"{p['turnaround']:.2f}"))
+        hidden = len(table) - TABLE_MAX_ROWS
+        if hidden > 0:
+            self.tree.insert("", "end", values=("…", f"+{hidden:,} more", "", "", "", ""))
 
         self.summary_label.delete(1.0, tk.END)
-        avg_wait, avg_turn = self.compute_avg_metrics(procs)
+        avg_wait, avg_turn = self.compute_avg_metrics(waiting, turnaround)
         
         self.summary_label.insert(tk.END, f"✨ Detailed Metrics for: {algo}\n", 'title')
         self.summary_label.insert(tk.END, f"{'='*60}\n")
         self.summary_label.insert(tk.END, f"⏱️  Average Waiting Time: {avg_wait:.2f} units\n", 'metric')
         self.summary_label.insert(tk.END, f"⏲️  Average Turnaround Time: {avg_turn:.2f} units\n", 'metric')
-        self.summary_label.insert(tk.END, f"🏁 Total Execution Time: {gantt[-1][2] if gantt else 0} units\n", 'metric')
-        self.summary_label.insert(tk.END, f"📊 Number of Processes: {len(procs)}\n", 'metric')
+        self.summary_label.insert(tk.END, f"🏁 Total Execution Time: {gantt_end(gantt)} units\n", 'metric')
+        self.summary_label.insert(tk.END, f"📊 Number of Processes: {len(table)}\n", 'metric')
         self.summary_label.insert(tk.END, f"{'='*60}\n")
         
         self.summary_label.tag_config('title', foreground='#41A0FF', font=('Consolas', 11, 'bold'))
@@ -678,24 +790,35 @@ class OSSimulator:
 
     def show_comparative_gantt_animated(self, all_results, quantum):
         """Show animated comparative Gantt chart in popup"""
-        algos = ["FCFS", "SJF", "Priority", "Round Robin"]
-        
-        unique_pids = sorted(list(set(pid for res in all_results.values() for pid, s, e in res['gantt'])))
-
-        cmap = cm.get_cmap('tab20')
-        pid_colors = {pid: cmap(i % 20) for i, pid in enumerate(unique_pids)}
-
-        max_time = 0
-        for res in all_results.values():
-            for pid, s, e in res['gantt']:
-                if e > max_time:
-                    max_time = e
+        load_matplotlib()
+        algos = list(all_results)
+        animate = sum(len(res['gantt']) for res in all_results.values()) <= ANIMATE_MAX_SLICES
+
+        if animate:
+            unique_pids = sorted(list(set(pid for res in all_results.values() for pid, *_ in res['gantt'])))
+            # Multi-core runs tag each slice with its core; every core gets its own lane
+            lanes = 1 + max((entry[3] for res in all_results.values() for entry in res['gantt'] if len(entry) > 3), default=0)
+            max_time = max((gantt_end(res['gantt']) for res in all_results.values()), default=0)
+        else:
+            pid_codes = {}
+            merged = [gantt_arrays(all_results[algo]['gantt'], pid_codes) for algo in algos]
+            unique_pids = sorted(pid_codes)
+            # Renumber the codes in sorted pid order so the colours match the legend
+            rank = {pid: i for i, pid in enumerate(unique_pids)}
+            renumber = np.array([rank[pid] for pid in pid_codes], dtype=np.int64)
+            merged = [(lane, start, end, renumber[code]) for lane, start, end, code in merged]
+            lanes = 1 + max((int(lane.max()) for lane, *_ in merged if len(lane)), default=0)
+            max_time = max((int(end.max()) for _, _, end, _ in merged if len(end)), default=0)
+
+        cmap = matplotlib.colormaps['tab20']
+        palette = [cmap(i) for i in range(20)]
+        pid_colors = {pid: palette[i % 20] for i, pid in enumerate(unique_pids)}
 
         if max_time == 0:
             max_time = 1
 
         win = tk.Toplevel(self.root)
-        win.title("🎬 Animated Comparative Gantt Charts")
+        win.title("🎬 Animated Comparative Gantt Charts" if animate else "📊 Comparative Gantt Charts")
         win.configure(bg=self.DARK_NAVY)
         win.geometry("1050x750")
 
@@ -706,7 +829,7 @@ class OSSimulator:
                 bg=self.DARK_NAVY, fg=self.ACCENT_BLUE,
                 font=("Calibri", 18, "bold")).pack()
 
-        fig, axs = plt.subplots(len(algos), 1, figsize=(10, 2.3 * len(algos)), 
+        fig, axs = plt.subplots(len(algos), 1, figsize=(10, 1.6 * len(algos)), 
                                sharex=True, facecolor=self.DARK_NAVY)
         if len(algos) == 1:
             axs = [axs]
@@ -719,14 +842,25 @@ class OSSimulator:
             ax.tick_params(axis='x', colors=self.TEXT_LIGHT)
             ax.set_yticks([])
             ax.set_xlim(0, max_time)
-            ax.set_xticks(list(range(0, max_time + 1, max(1, max_time // 10)))) # Dynamic ticks
+            ax.xaxis.set_major_locator(matplotlib.ticker.MaxNLocator(10, integer=True))  # Follows pan and zoom
             ax.set_xlabel('Time (units)', color=self.TEXT_LIGHT, fontsize=10)
             ax.grid(True, alpha=0.2, color=self.TEXT_LIGHT)
+            # Bars are blitted over the grid, so full redraws put it below them too
+            ax.set_axisbelow(True)
+            # Fixed limits: the view never autoscales while slices are blitted in
+            if lanes > 1:
+                ax.set_yticks([core * 6 + 2.5 for core in range(lanes)])
+                ax.set_yticklabels([f"Core {core}" for core in range(lanes)], fontsize=8)
+                ax.set_ylim(-0.5, lanes * 6)
+            else:
+                ax.set_ylim(-0.25, 5.25)
 
         plt.tight_layout()
 
         canvas = FigureCanvasTkAgg(fig, master=win)
-        canvas.draw()
+        toolbar = NavigationToolbar2Tk(canvas, win, pack_toolbar=False)
+        toolbar.update()
+        toolbar.pack(fill='x', padx=10)
         canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=5)
 
         # Legend
@@ -737,7 +871,7 @@ class OSSimulator:
                 bg=self.DARK_NAVY, fg=self.TEXT_LIGHT, 
                 font=("Calibri", 10, "bold")).pack(side='left', padx=10)
         
-        for pid in unique_pids:
+        for pid in unique_pids[:LEGEND_MAX_PIDS]:
             c = pid_colors[pid]
             hex_color = matplotlib.colors.to_hex(c)
             sw = tk.Canvas(legend_frame, width=20, height=16, bg=self.DARK_NAVY, highlightthickness=0)
@@ -745,85 +879,151 @@ class OSSimulator:
             lbl = tk.Label(legend_frame, text=f" {pid} ", bg=self.DARK_NAVY, fg=self.TEXT_LIGHT, font=("Consolas", 9, "bold"))
             sw.pack(side='left', padx=(8, 2))
             lbl.pack(side='left', padx=(0, 8))
+        if len(unique_pids) > LEGEND_MAX_PIDS:
+            tk.Label(legend_frame, text=f"+{len(unique_pids) - LEGEND_MAX_PIDS} more",
+                     bg=self.DARK_NAVY, fg=self.TEXT_LIGHT, font=("Consolas", 9)).pack(side='left')
             
         # Metrics comparison frame (hidden initially)
         self.metrics_frame = tk.Frame(win, bg=self.MID_BLUE, relief='solid', bd=2)
-        
-        # Animation state
-        animation_data = {'current_time': 0, 'completed': False, 'interval_ms': 100}
+
+        def show_metrics():
+            self.metrics_frame.pack(fill='x', padx=20, pady=10)
+
+            # Clear previous content
+            for widget in self.metrics_frame.winfo_children():
+                widget.destroy()
+
+            tk.Label(self.metrics_frame, text="⚡ Performance Comparison", 
+                    bg=self.MID_BLUE, fg='#FFD700', 
+                    font=("Calibri", 12, "bold")).pack(pady=5)
+            
+            for algo in algos:
+                avg_wait, avg_turn = all_results[algo]['avg']
+                metric_text = f"[{algo.ljust(12)}]: Avg Wait={avg_wait:.2f}, Avg Turnaround={avg_turn:.2f}"
+                tk.Label(self.metrics_frame, text=metric_text, 
+                        bg=self.MID_BLUE, fg=self.TEXT_LIGHT,
+                        font=("Consolas", 10)).pack(anchor='w', padx=20, pady=2)
+
+        animation_data = {'current_time': 0, 'completed': not animate, 'interval_ms': 100, 'background': None}
+
+        def on_close():
+            animation_data['completed'] = True
+            plt.close(fig)
+            win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", on_close)
+
+        if not animate:
+            # Too many slices to replay: draw the whole chart at once and let
+            # every pan, zoom or resize pick the level of detail again
+            details = [GanttDetail(ax, *data, np.array(palette), unique_pids) for ax, data in zip(axs, merged)]
+
+            def refresh_details(*_):
+                for detail in details:
+                    detail.refresh()
+
+            for ax, detail in zip(axs, details):
+                ax.callbacks.connect('xlim_changed', lambda ax, detail=detail: detail.refresh())
+            canvas.mpl_connect('resize_event', refresh_details)
+            refresh_details()
+            canvas.draw()
+            show_metrics()
+            return
+
+        # Animation state. Slices are replayed in start order; each one is a
+        # Rectangle that is animated while it grows and is then baked into the
+        # blitted background, so a frame only touches slices that changed.
+        queues = [sorted(all_results[algo]['gantt'], key=lambda entry: entry[1]) for algo in algos]
+        next_slice = [0] * len(algos)
+        running = [[] for _ in algos]  # [entry, rectangle, label or None] per axis
+        markers = [ax.axvline(x=0, color='red', linestyle='--', linewidth=1.5, animated=True) for ax in axs]
+
+        def capture_background(event=None):
+            # Every full redraw (first show, resize) renders the static axes and
+            # the baked slices; the animated artists are blitted on top of it
+            animation_data['background'] = canvas.copy_from_bbox(fig.bbox)
+
+        canvas.mpl_connect('draw_event', capture_background)
+        canvas.draw()
+
+        def slice_label(ax, entry, duration, lane):
+            pid, start = entry[0], entry[1]
+            color = pid_colors.get(pid, (0.6, 0.6, 0.6))
+            return ax.text(start + duration / 2, lane + 2.5, pid,
+                           ha='center', va='center',
+                           color='black' if sum(color[:3]) > 1.5 else 'white',
+                           fontsize=9, fontweight='bold', animated=True)
 
         def animate_gantt():
             if animation_data['completed']:
                 return
-            
+
             t = animation_data['current_time']
-            
-            for ax, algo in zip(axs, algos):
-                ax.clear()
-                ax.set_facecolor(self.DARK_NAVY)
-                ax.set_ylabel(algo, color=self.TEXT_LIGHT, fontsize=11, fontweight='bold')
-                ax.tick_params(axis='y', colors=self.TEXT_LIGHT)
-                ax.tick_params(axis='x', colors=self.TEXT_LIGHT)
-                ax.set_yticks([])
-                ax.set_xlim(0, max_time)
-                ax.set_xticks(list(range(0, max_time + 1, max(1, max_time // 10))))
-                ax.set_xlabel('Time (units)', color=self.TEXT_LIGHT, fontsize=10)
-                ax.grid(True, alpha=0.2, color=self.TEXT_LIGHT)
-                
-                gantt = all_results.get(algo, {}).get('gantt', [])
-                for pid, start, end in gantt:
-                    if start < t:
-                        visible_end = min(end, t)
-                        duration = visible_end - start
-                        ax.broken_barh([(start, duration)], (0, 5), 
-                                      facecolors=[pid_colors.get(pid, (0.6, 0.6, 0.6))],
-                                      edgecolors='white', linewidth=1.5)
-                        
-                        # Add PID label when execution finishes or is running for a while
-                        if duration > 0 and (visible_end == end or duration > 1.5):
-                            ax.text(start + duration / 2, 2.5, pid, 
-                                   ha='center', va='center', 
-                                   color='black' if sum(pid_colors.get(pid, (0.6,0.6,0.6))[:3]) > 1.5 else 'white', 
-                                   fontsize=9, fontweight='bold')
-                            
+            canvas.restore_region(animation_data['background'])
+            baked = False
+
+            for k, ax in enumerate(axs):
+                queue = queues[k]
+                while next_slice[k] < len(queue) and queue[next_slice[k]][1] < t:
+                    entry = queue[next_slice[k]]
+                    lane = entry[3] * 6 if len(entry) > 3 else 0
+                    rect = matplotlib.patches.Rectangle((entry[1], lane), 0, 5,
+                                                        facecolor=pid_colors.get(entry[0], (0.6, 0.6, 0.6)),
+                                                        edgecolor='white', linewidth=1.5, animated=True)
+                    ax.add_patch(rect)
+                    running[k].append([entry, rect, None])
+                    next_slice[k] += 1
+
+                still_running = []
+                for item in running[k]:
+                    entry, rect, label = item
+                    start, end = entry[1], entry[2]
+                    visible_end = min(end, t)
+                    duration = visible_end - start
+                    lane = entry[3] * 6 if len(entry) > 3 else 0
+                    rect.set_width(duration)
+
+                    # Add PID label when execution finishes or is running for a while
+                    if duration > 0 and (visible_end == end or duration > 1.5):
+                        if label is None:
+                            label = item[2] = slice_label(ax, entry, duration, lane)
+                        label.set_x(start + duration / 2)
+
+                    if visible_end == end:
+                        # Finished: draw it into the background once and let
+                        # full redraws pick it up from now on
+                        for artist in (rect, label):
+                            if artist is not None:
+                                ax.draw_artist(artist)
+                                artist.set_animated(False)
+                        baked = True
+                    else:
+                        still_running.append(item)
+                running[k] = still_running
+
+            if baked:
+                capture_background()
+
+            for k, ax in enumerate(axs):
+                for _, rect, label in running[k]:
+                    ax.draw_artist(rect)
+                    if label is not None:
+                        ax.draw_artist(label)
                 # Draw the current time marker
-                ax.axvline(x=t, color='red', linestyle='--', linewidth=1.5)
+                markers[k].set_xdata([t, t])
+                ax.draw_artist(markers[k])
+
+            canvas.blit(fig.bbox)
 
-            canvas.draw()
-            
             animation_data['current_time'] += 0.5
             if animation_data['current_time'] > max_time + 1:
                 animation_data['completed'] = True
-                
                 # Show final metrics comparison
-                self.metrics_frame.pack(fill='x', padx=20, pady=10)
-                
-                # Clear previous content
-                for widget in self.metrics_frame.winfo_children():
-                    widget.destroy()
-
-                tk.Label(self.metrics_frame, text="⚡ Performance Comparison", 
-                        bg=self.MID_BLUE, fg='#FFD700', 
-                        font=("Calibri", 12, "bold")).pack(pady=5)
-                
-                for algo in algos:
-                    avg_wait, avg_turn = all_results[algo]['avg']
-                    metric_text = f"[{algo.ljust(12)}]: Avg Wait={avg_wait:.2f}, Avg Turnaround={avg_turn:.2f}"
-                    tk.Label(self.metrics_frame, text=metric_text, 
-                            bg=self.MID_BLUE, fg=self.TEXT_LIGHT,
-                            font=("Consolas", 10)).pack(anchor='w', padx=20, pady=2)
-                
+                show_metrics()
                 return
             
             win.after(animation_data['interval_ms'], animate_gantt)
 
-        def on_close():
-            animation_data['completed'] = True
-            plt.close(fig)
-            win.destroy()
-        
-        win.protocol("WM_DELETE_WINDOW", on_close)
-        
         # Start animation after window is visible
         win.after(300, animate_gantt)
 
@@ -849,26 +1049,70 @@ class OSSimulator:
             self.mem_progress.stop_animation()
             self.run_mem_btn.config(state='normal')
 
+    def read_reference_pages(self):
+        ref_str = self.ref_entry.get().strip()
+        if not ref_str:
+            raise ValueError("Please enter a reference string.")
+        if ref_str.startswith("trace:"):
+            path = ref_str[len("trace:"):]
+            if self.trace is None or self.trace.path != path:
+                self.open_trace(path)
+            return self.trace.pages
+        return list(iter_references(ref_str))
+
+    def pool_source(self, pages):
+        # Worker pools reopen a mapped trace by path rather than each getting a copy
+        return self.trace if self.trace is not None and pages is self.trace.pages else pages
+
+    def read_frame_count(self):
+        frames = int(self.frame_entry.get()) if self.frame_entry.get().isdigit() and int(self.frame_entry.get()) > 0 else 3
+        if frames <= 0:
+             raise ValueError("Number of frames must be positive.")
+        return frames
+
+    def open_trace(self, path):
+        trace = PageTrace(path)
+        if self.trace is not None:
+            # Nothing may read the old trace's pages once it is closed
+            if self.animator:
+                self.animator.stop_animation()
+                self.animator = None
+            if self.curve_job:
+                self._finish_fault_curve()
+            if self.compare_job:
+                self._finish_compare_job()
+            self.trace.close()
+        self.trace = trace
+
+    def load_trace(self):
+        path = filedialog.askopenfilename(title="Load page trace",
+                                          filetypes=[("Page traces", "*.trace *.bin"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.open_trace(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Memory Simulation Error", str(e))
+            return
+        self.ref_entry.delete(0, tk.END)
+        self.ref_entry.insert(0, f"trace:{path}")
+
     def run_memory(self):
         try:
-            ref_str = self.ref_entry.get().strip()
-            if not ref_str:
-                raise ValueError("Please enter a reference string.")
-            pages = [int(x.strip()) for x in ref_str.split(',') if x.strip() !=""]
-
-            frames = int(self.frame_entry.get()) if self.frame_entry.get().isdigit() and int(self.frame_entry.get()) > 0 else 3
-            if frames <= 0:
-                 raise ValueError("Number of frames must be positive.")
-                 
+            pages = self.read_reference_pages()
+
+            frames = self.read_frame_count()
             algo = self.mem_algo.get()
 
+            replace = MEMORY_ALGORITHMS[algo]
+            if len(pages) > ANIMATE_MAX_REFERENCES:
+                # Too long to step through: count faults without a history
+                faults, _ = replace(pages, frames, record="none")
+                self.show_memory_summary(len(pages), frames, algo, faults)
+                return
+
             # Execute the algorithm to get the full trace history
-            if algo == 'FIFO':
-                faults, history = fifo_page_replacement(pages, frames)
-            elif algo == 'LRU':
-                faults, history = lru_page_replacement(pages, frames)
-            else:
-                faults, history = optimal_page_replacement(pages, frames)
+            faults, history = replace(pages, frames)
 
             # Start the animated trace instead of static output
             self.animator = self.MemoryTraceAnimator(self.memory_output, history, pages, frames, algo, self.root)
@@ -878,6 +1122,195 @@ class OSSimulator:
             # Re-raise the exception to be caught by _execute_memory
             raise e
 
+    def show_memory_summary(self, references, frames, algo, faults):
+        out = self.memory_output
+        out.delete('1.0', tk.END)
+        out.tag_config('title', foreground='#41A0FF', font=('Consolas', 11, 'bold'))
+        out.tag_config('header', foreground='#60B0FF')
+        out.tag_config('info', foreground='#E0FBFC')
+        out.tag_config('faults', foreground='#FF6B6B', font=('Consolas', 10, 'bold'))
+        out.tag_config('hits', foreground='#51CF66', font=('Consolas', 10, 'bold'))
+        out.insert(tk.END, "="*70 + "\n", 'header')
+        out.insert(tk.END, f"🎯 {algo} PAGE REPLACEMENT ALGORITHM (SUMMARY)\n", 'title')
+        out.insert(tk.END, "="*70 + "\n", 'header')
+        out.insert(tk.END, f"📄 References: {references:,} (too many to animate)\n", 'info')
+        out.insert(tk.END, f"🗂️  Number of Frames: {frames}\n", 'info')
+        out.insert(tk.END, "="*70 + "\n", 'header')
+        out.insert(tk.END, f"❌ Total Page Faults: {faults:,}\n", 'faults')
+        out.insert(tk.END, f"✅ Hit Ratio: {((references - faults) / references * 100):.2f}%\n", 'hits')
+        out.insert(tk.END, "="*70 + "\n", 'header')
+
+    def compare_memory_policies(self):
+        """Run every policy over the reference string and compare them"""
+        if self.animator:
+            self.animator.stop_animation()
+            self.animator = None
+        try:
+            pages = self.read_reference_pages()
+            frames = self.read_frame_count()
+            # Policies run while the window stays responsive; _poll_compare_job
+            # shows the comparison once all are in
+            self.compare_job = PolicyComparison(self.pool_source(pages), frames)
+        except Exception as e:
+            messagebox.showerror("Memory Simulation Error", str(e))
+            return
+        self.compare_mem_btn.config(state='disabled')
+        self.mem_progress.start_animation()
+        # Let the button and progress bar repaint before the first policy runs
+        self.root.after(20, self._poll_compare_job, self.compare_job)
+
+    def _poll_compare_job(self, job):
+        if job is not self.compare_job:
+            # Cancelled when another trace was opened
+            return
+        try:
+            job.poll()
+            if not job.done():
+                self.root.after(20, self._poll_compare_job, job)
+                return
+            self.show_policy_comparison(job.results(), job.references, job.frames)
+        except Exception as e:
+            messagebox.showerror("Memory Simulation Error", str(e))
+        self._finish_compare_job()
+
+    def _finish_compare_job(self):
+        self.compare_job.close()
+        self.compare_job = None
+        self.mem_progress.stop_animation()
+        self.compare_mem_btn.config(state='normal')
+
+    def show_policy_comparison(self, results, references, frames):
+        out = self.memory_output
+        out.delete('1.0', tk.END)
+        out.tag_config('title', foreground='#41A0FF', font=('Consolas', 11, 'bold'))
+        out.tag_config('header', foreground='#60B0FF')
+        out.tag_config('table_header', foreground='#FFD700', font=('Consolas', 10, 'bold'))
+        out.tag_config('info', foreground='#E0FBFC')
+        out.tag_config('hits', foreground='#51CF66', font=('Consolas', 10, 'bold'))
+        out.insert(tk.END, "="*70 + "\n", 'header')
+        out.insert(tk.END, f"📊 PAGE REPLACEMENT COMPARISON ({references:,} references, {frames} frames)\n", 'title')
+        out.insert(tk.END, "="*70 + "\n", 'header')
+        out.insert(tk.END, f"{'Algorithm':<18}{'Faults':>12}{'Hits':>12}{'Hit Ratio':>12}\n", 'table_header')
+        out.insert(tk.END, "-"*70 + "\n", 'header')
+        ranked = sorted(results.items(), key=lambda item: item[1]["faults"])
+        for rank, (algo, entry) in enumerate(ranked):
+            line = (f"{algo:<18}{entry['faults']:>12,}{references - entry['faults']:>12,}"
+                    f"{entry['hit_ratio'] * 100:>11.2f}%\n")
+            out.insert(tk.END, line, 'hits' if rank == 0 else 'info')
+        out.insert(tk.END, "="*70 + "\n", 'header')
+
+        load_matplotlib()
+        win = tk.Toplevel(self.root)
+        win.title("📊 Page Faults over Time")
+        win.configure(bg=self.DARK_NAVY)
+        win.geometry("900x560")
+
+        fig, ax = plt.subplots(figsize=(9, 5), facecolor=self.DARK_NAVY)
+        ax.set_facecolor(self.DARK_NAVY)
+        colors = plt.get_cmap('tab10')
+        for i, (algo, entry) in enumerate(results.items()):
+            ax.plot(entry["steps"], entry["curve"], color=colors(i % 10), linewidth=2, label=algo)
+        ax.set_xlabel('References', color=self.TEXT_LIGHT, fontsize=10)
+        ax.set_ylabel('Cumulative Page Faults', color=self.TEXT_LIGHT, fontsize=10)
+        ax.set_title(f"Faults over time with {frames} frames", color=self.TEXT_LIGHT, fontsize=12, fontweight='bold')
+        ax.tick_params(colors=self.TEXT_LIGHT)
+        ax.grid(True, alpha=0.2, color=self.TEXT_LIGHT)
+        ax.legend(facecolor=self.MID_BLUE, labelcolor=self.TEXT_LIGHT)
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+
+        def on_close():
+            plt.close(fig)
+            win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", on_close)
+
+    def show_fault_curve(self):
+        """Plot page faults against frame count for every policy in a popup"""
+        try:
+            pages = self.read_reference_pages()
+            if not len(pages):
+                raise ValueError("The reference string has no pages to plot.")
+            # Counting the distinct pages would scan the whole trace here, so the
+            # bound caps the Optimal and FIFO sweeps; LRU finds the count itself
+            max_frames = max(FAULT_CURVE_MAX_FRAMES, self.read_frame_count())
+            # The curves are computed while the window stays responsive;
+            # _poll_fault_curve draws them once all are in
+            self.curve_job = FaultCurveSweep(self.pool_source(pages), max_frames)
+        except Exception as e:
+            messagebox.showerror("Memory Simulation Error", str(e))
+            return
+        self.curve_run = {"references": len(pages)}
+        self.curve_btn.config(state='disabled')
+        self.mem_progress.start_animation()
+        # Let the button and progress bar repaint before the first job runs
+        self.root.after(20, self._poll_fault_curve, self.curve_job)
+
+    def _poll_fault_curve(self, job):
+        if job is not self.curve_job:
+            # Cancelled when another trace was opened
+            return
+        try:
+            job.poll()
+            if not job.done():
+                self.root.after(20, self._poll_fault_curve, job)
+                return
+            self.draw_fault_curve(job.curves, **self.curve_run)
+        except Exception as e:
+            messagebox.showerror("Memory Simulation Error", str(e))
+        self._finish_fault_curve()
+
+    def _finish_fault_curve(self):
+        self.curve_job.close()
+        self.curve_job = None
+        self.mem_progress.stop_animation()
+        self.curve_btn.config(state='normal')
+
+    def draw_fault_curve(self, curves, references):
+        # LRU runs to the number of distinct pages; Optimal and FIFO may stop short
+        distinct, max_frames = len(curves["LRU"]), len(curves["FIFO"])
+        anomalies = belady_anomalies(curves["FIFO"])
+
+        load_matplotlib()
+        win = tk.Toplevel(self.root)
+        win.title("📉 Page Faults vs Frames")
+        win.configure(bg=self.DARK_NAVY)
+        win.geometry("900x560")
+
+        fig, ax = plt.subplots(figsize=(9, 5), facecolor=self.DARK_NAVY)
+        ax.set_facecolor(self.DARK_NAVY)
+        for (algo, faults), color in zip(curves.items(), ('#FFB84D', '#41A0FF', '#51CF66')):
+            # Markers only while they stay apart
+            marker = 'o' if len(faults) <= 200 else None
+            ax.plot(range(1, len(faults) + 1), faults, marker=marker, markersize=3, color=color, linewidth=2,
+                    label=algo)
+        if anomalies:
+            ax.scatter(anomalies, [curves["FIFO"][f - 1] for f in anomalies], s=90, facecolors='none',
+                       edgecolors='#FF6B6B', linewidths=2, zorder=3, label="Belady's anomaly")
+        ax.set_xlabel('Number of Frames', color=self.TEXT_LIGHT, fontsize=10)
+        ax.set_ylabel('Page Faults', color=self.TEXT_LIGHT, fontsize=10)
+        title = f"Fault curve over {references:,} references, 1-{distinct:,} frames"
+        if max_frames < distinct:
+            title += f" (Optimal and FIFO stop at {max_frames})"
+        ax.set_title(title, color=self.TEXT_LIGHT, fontsize=12, fontweight='bold')
+        ax.tick_params(colors=self.TEXT_LIGHT)
+        ax.grid(True, alpha=0.2, color=self.TEXT_LIGHT)
+        ax.legend(facecolor=self.MID_BLUE, labelcolor=self.TEXT_LIGHT)
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+
+        def on_close():
+            plt.close(fig)
+            win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", on_close)
+
 
 if __name__ == '__main__':
     root = tk.Tk()
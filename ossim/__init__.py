@@ -0,0 +1,31 @@
+"""CPU scheduling and page replacement algorithms without any GUI dependencies.
+
+The public API is re-exported here; tuning thresholds such as
+scheduling.PARALLEL_COMPARE_MIN stay in their modules.
+"""
+from ossim.scheduling import (
+    MULTICORE_ENGINES, SCHEDULERS,
+    LazyGantt, ProcessTable, QuantumSweep, SchedulerComparison,
+    best_quantum, fcfs_engine, gantt_end, mlfq_engine, multicore_engine, parse_quanta,
+    parse_workload, preemptive_priority_engine, priority_engine, rr_engine,
+    rr_quantum_metrics, rr_quantum_sweep, run_scheduler, sjf_engine, srtf_engine,
+    fcfs_scheduling, mlfq_scheduling, multicore_scheduling, preemptive_priority_scheduling,
+    priority_scheduling, round_robin, sjf_scheduling, srtf_scheduling,
+)
+from ossim.paging import (
+    HISTORY_LEVELS, MEMORY_ALGORITHMS, STREAM_POLICIES,
+    ARCPolicy, ClockPolicy, FaultCurveSweep, FenwickTree, FIFOPolicy, LFUPolicy, LRUPolicy,
+    OptimalPolicy, PageHistory, PolicyComparison, SecondChancePolicy, TwoQueuePolicy,
+    arc_page_replacement, belady_anomalies, clock_page_replacement, compare_policies,
+    fifo_fault_count, fifo_frame_sweep, fifo_page_replacement, lfu_page_replacement,
+    lru_page_replacement, lru_stack_distances, miss_ratio_curve, next_use_index,
+    opt_stack_distances, optimal_page_replacement, second_chance_page_replacement,
+    stream_fault_stats, stream_faults, two_queue_page_replacement,
+)
+from ossim.generators import (
+    BURST_MODELS, TRACE_MODELS,
+    generate_workload, loop_references, phase_references, workload_rows, working_set_references,
+    zipf_references,
+)
+from ossim.jobs import JobBatch
+from ossim.traces import TRACE_HEADER, TRACE_MAGIC, TRACE_VERSION, PageTrace, iter_references, write_trace
@@ -0,0 +1,5 @@
+import sys
+
+from ossim.cli import main
+
+sys.exit(main())
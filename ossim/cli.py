@@ -0,0 +1,260 @@
+"""Headless entry point: python -m ossim {schedule,paging,workload,trace} ...
+
+Reads a workload or reference trace from a file or stdin, runs the chosen
+algorithms and writes their metrics as JSON or CSV, or generates seeded
+workloads and traces for them. Nothing here imports Tk or matplotlib.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from array import array
+from contextlib import nullcontext
+from itertools import chain
+
+from ossim import (
+    BURST_MODELS, MEMORY_ALGORITHMS, MULTICORE_ENGINES, SCHEDULERS, STREAM_POLICIES, TRACE_MAGIC, TRACE_MODELS,
+    PageTrace, SchedulerComparison,
+    compare_policies, gantt_end, iter_references, parse_workload, stream_fault_stats, workload_rows, write_trace,
+)
+
+# Model-specific trace options, passed on only when given so the generator
+# defaults apply otherwise
+TRACE_OPTIONS = {
+    "zipf": ("exponent",),
+    "loop": ("noise",),
+    "phase": ("set_size", "phase_length"),
+    "working-set": ("set_size", "locality"),
+}
+
+
+def _open_input(path):
+    # stdin is left open for the caller
+    return nullcontext(sys.stdin) if path == "-" else open(path)
+
+
+def run_schedule(args):
+    with _open_input(args.workload) as fh:
+        table = parse_workload(fh)
+    if args.cores > 1:
+        algos = args.algo or list(MULTICORE_ENGINES)
+        for algo in algos:
+            if algo not in MULTICORE_ENGINES:
+                raise ValueError(f"{algo} runs on a single core only; use --cores 1.")
+    else:
+        algos = args.algo or list(SCHEDULERS)
+
+    job = SchedulerComparison(table, algos, args.quantum, args.boost, args.cores, args.dispatch)
+    try:
+        finished = dict(job)
+    finally:
+        job.close()
+
+    n, results = len(table), {}
+    for algo in algos:
+        gantt, waiting, turnaround = finished[algo]
+        entry = {"avg_waiting": float(sum(waiting) / n), "avg_turnaround": float(sum(turnaround) / n),
+                 "makespan": int(gantt_end(gantt))}
+        if args.per_process:
+            entry["per_process"] = table.to_dicts(waiting, turnaround, rows=table.arrival_order())
+        results[algo] = entry
+    return {"processes": n, "cores": args.cores, "quantum": args.quantum, "results": results}
+
+
+def _is_binary_trace(path):
+    # Binary traces are recognised by their magic; anything else is parsed as
+    # comma or whitespace separated page numbers
+    if path == "-":
+        return False
+    with open(path, "rb") as fh:
+        return fh.read(len(TRACE_MAGIC)) == TRACE_MAGIC
+
+
+def run_paging(args):
+    algos = args.algo or list(MEMORY_ALGORITHMS)
+    binary = _is_binary_trace(args.trace)
+    if len(algos) == 1 and algos[0] in STREAM_POLICIES and not binary:
+        # A single online policy never needs the whole trace: stream the text
+        # through it in O(frames) memory
+        with _open_input(args.trace) as fh:
+            stats = list(stream_fault_stats(iter_references(fh), args.frames, algos[0], sys.maxsize))
+        references, _, faults = stats[-1] if stats else (0, 0, 0)
+        counts = {algos[0]: faults}
+    else:
+        if binary:
+            trace = PageTrace(args.trace)
+        else:
+            with _open_input(args.trace) as fh:
+                trace = array('q', iter_references(fh))
+        mapped = isinstance(trace, PageTrace)
+        try:
+            # A mapped trace is passed whole so that worker processes reopen it
+            # by path instead of each receiving a copy
+            references = len(trace)
+            results = compare_policies(trace, args.frames, algos, window=max(1, references))
+            counts = {algo: entry["faults"] for algo, entry in results.items()}
+        finally:
+            if mapped:
+                trace.close()
+
+    return {"references": references, "frames": args.frames,
+            "results": {algo: {"faults": faults, "hits": references - faults,
+                               "hit_ratio": (references - faults) / references if references else 0.0}
+                        for algo, faults in counts.items()}}
+
+
+def _parse_priorities(text):
+    # "1:3,2:1" -> {1: 3.0, 2: 1.0}
+    mix = {}
+    for part in text.split(","):
+        priority, _, weight = part.partition(":")
+        try:
+            mix[int(priority)] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Bad priority mix entry: {part.strip()!r} (expected PRIORITY[:WEIGHT]).") from None
+    return mix
+
+
+def _started(items):
+    # Generators only validate their arguments on the first step; take it
+    # before any output file is created
+    items = iter(items)
+    first = next(items, None)
+    return items if first is None else chain((first,), items)
+
+
+def run_workload(args):
+    priorities = _parse_priorities(args.priorities) if args.priorities else None
+    rows = _started(workload_rows(args.count, args.seed, args.rate, args.burst, args.mean_burst, args.alpha,
+                                  priorities))
+    with nullcontext(sys.stdout) if args.output == "-" else open(args.output, "w") as out:
+        out.write("# PID Arrival Burst Priority\n")
+        for row in rows:
+            out.write("%s %d %d %d\n" % row)
+
+
+def run_trace(args):
+    options = {}
+    for name in sorted({name for names in TRACE_OPTIONS.values() for name in names}):
+        if getattr(args, name) is None:
+            continue
+        if name not in TRACE_OPTIONS[args.model]:
+            raise ValueError(f"--{name.replace('_', '-')} does not apply to {args.model} traces.")
+        options[name] = getattr(args, name)
+    pages = _started(TRACE_MODELS[args.model](args.count, args.pages, args.seed, **options))
+    write_trace(args.output, pages, "I" if args.pages <= 1 << 32 else "Q")
+
+
+def write_csv(report, out, per_process=False):
+    writer = csv.writer(out, lineterminator="\n")
+    if "processes" not in report:
+        writer.writerow(["algorithm", "references", "frames", "faults", "hits", "hit_ratio"])
+        for algo, entry in report["results"].items():
+            writer.writerow([algo, report["references"], report["frames"],
+                             entry["faults"], entry["hits"], f"{entry['hit_ratio']:.6f}"])
+    elif per_process:
+        writer.writerow(["algorithm", "pid", "arrival", "burst", "priority", "waiting", "turnaround"])
+        for algo, entry in report["results"].items():
+            for p in entry["per_process"]:
+                writer.writerow([algo, p["pid"], p["arrival"], p["burst"], p["priority"],
+                                 p["waiting"], p["turnaround"]])
+    else:
+        writer.writerow(["algorithm", "processes", "avg_waiting", "avg_turnaround", "makespan"])
+        for algo, entry in report["results"].items():
+            writer.writerow([algo, report["processes"], f"{entry['avg_waiting']:.6f}",
+                             f"{entry['avg_turnaround']:.6f}", entry["makespan"]])
+
+
+def _count(text):
+    # Accept 100000 as well as 1e5
+    try:
+        return int(float(text))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count: {text!r}") from None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m ossim",
+                                     description="Run CPU schedulers or page replacement policies headlessly.")
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=("json", "csv"), default="json", help="output format (default: json)")
+    output.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schedule = commands.add_parser("schedule", parents=[output], help="run CPU schedulers on a workload")
+    schedule.add_argument("workload", nargs="?", default="-",
+                          help='file of "PID Arrival Burst [Priority]" lines, or - for stdin')
+    schedule.add_argument("--algo", action="append", choices=SCHEDULERS,
+                          help="algorithm to run; repeat for several (default: all)")
+    schedule.add_argument("--quantum", type=int, default=2, help="Round Robin quantum (default: 2)")
+    schedule.add_argument("--boost", type=int, default=0, help="MLFQ boost interval, 0 = off")
+    schedule.add_argument("--cores", type=int, default=1, help="number of CPU cores (default: 1)")
+    schedule.add_argument("--dispatch", choices=("global", "per-core"), default="global",
+                          help="multi-core dispatch mode (default: global)")
+    schedule.add_argument("--per-process", action="store_true", help="include waiting and turnaround per process")
+    schedule.set_defaults(run=run_schedule)
+
+    paging = commands.add_parser("paging", parents=[output], help="run page replacement policies on a reference trace")
+    paging.add_argument("trace", nargs="?", default="-",
+                        help="binary trace file, text file of page numbers, or - for stdin")
+    paging.add_argument("--frames", type=int, required=True, help="number of page frames")
+    paging.add_argument("--algo", action="append", choices=list(MEMORY_ALGORITHMS),
+                        help="policy to run; repeat for several (default: all)")
+    paging.set_defaults(run=run_paging)
+
+    workload = commands.add_parser("workload", help="generate a seeded process workload")
+    workload.add_argument("count", type=_count, help="number of processes, e.g. 1e5")
+    workload.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    workload.add_argument("--seed", type=int, help="random seed (default: different every run)")
+    workload.add_argument("--rate", type=float, default=0.1, help="Poisson arrivals per time unit (default: 0.1)")
+    workload.add_argument("--burst", choices=BURST_MODELS, default="exponential",
+                          help="burst length distribution (default: exponential)")
+    workload.add_argument("--mean-burst", type=float, default=8.0, help="mean burst length (default: 8)")
+    workload.add_argument("--alpha", type=float, default=1.5, help="Pareto shape, above 1 (default: 1.5)")
+    workload.add_argument("--priorities", help='priority mix as PRIORITY:WEIGHT pairs, e.g. "1:3,5:1" '
+                                               "(default: 1..5 equally likely)")
+    workload.set_defaults(run=run_workload)
+
+    trace = commands.add_parser("trace", help="generate a seeded binary page reference trace")
+    trace.add_argument("model", choices=TRACE_MODELS, help="reference pattern")
+    trace.add_argument("count", type=_count, help="number of references, e.g. 1e8")
+    trace.add_argument("output", help="trace file to write")
+    trace.add_argument("--pages", type=_count, required=True, help="number of distinct pages")
+    trace.add_argument("--seed", type=int, help="random seed (default: different every run)")
+    trace.add_argument("--exponent", type=float, help="zipf: skew exponent (default: 1.0)")
+    trace.add_argument("--noise", type=float, help="loop: fraction of random references (default: 0)")
+    trace.add_argument("--set-size", type=_count, help="phase, working-set: pages in the set (default: pages / 10)")
+    trace.add_argument("--phase-length", type=_count, help="phase: references per phase (default: 10000)")
+    trace.add_argument("--locality", type=float, help="working-set: chance of staying in the set (default: 0.9)")
+    trace.set_defaults(run=run_trace)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    for option in ("quantum", "cores", "frames", "pages"):
+        if getattr(args, option, 1) <= 0:
+            parser.error(f"--{option} must be positive")
+    if getattr(args, "boost", 0) < 0:
+        parser.error("--boost must not be negative")
+    try:
+        report = args.run(args)
+        if report is None:
+            # The generators write their own output
+            return 0
+        with nullcontext(sys.stdout) if args.output == "-" else open(args.output, "w", newline="") as out:
+            if args.format == "json":
+                json.dump(report, out, indent=2)
+                out.write("\n")
+            else:
+                write_csv(report, out, getattr(args, "per_process", False))
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); silence the final flush
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,138 @@
+"""Seeded synthetic workloads and page reference traces.
+
+Every generator takes a seed and yields its output one item at a time, so the
+same seed always reproduces the same scenario and even 10^8-element traces can
+be streamed into write_trace() or a stream_faults() run without building a list.
+"""
+import random
+from array import array
+from bisect import bisect
+from itertools import accumulate
+
+from ossim.scheduling import ProcessTable
+
+BURST_MODELS = ("exponential", "pareto")
+
+
+def _cumulative(weights):
+    totals = array('d', accumulate(weights))
+    if not totals or totals[-1] <= 0 or min(weights) < 0:
+        raise ValueError("Weights must be non-negative and not all zero.")
+    return totals
+
+
+def workload_rows(n, seed=None, rate=0.1, burst="exponential", mean_burst=8.0, alpha=1.5, priorities=None):
+    """Yield (pid, arrival, burst, priority) for n processes.
+
+    Arrivals form a Poisson process with 'rate' arrivals per time unit. Bursts
+    are exponential or Pareto (shape 'alpha', which must exceed 1) with mean
+    'mean_burst', rounded to whole units of at least 1. 'priorities' maps each
+    priority to its relative weight and defaults to 1..5 equally likely.
+    """
+    if n < 0 or rate <= 0 or mean_burst <= 0:
+        raise ValueError("Process count must not be negative; rate and mean burst must be positive.")
+    if burst not in BURST_MODELS:
+        raise ValueError(f"Unknown burst model: {burst} (choose from {', '.join(BURST_MODELS)}).")
+    if burst == "pareto" and alpha <= 1:
+        raise ValueError("Pareto bursts need alpha > 1 for the mean to exist.")
+    levels = list(priorities or range(1, 6))
+    totals = _cumulative([priorities[p] for p in levels] if priorities else [1] * len(levels))
+    # Pareto scale that gives the requested mean
+    scale = mean_burst * (alpha - 1) / alpha
+
+    rng, t = random.Random(seed), 0.0
+    for i in range(1, n + 1):
+        t += rng.expovariate(rate)
+        if burst == "exponential":
+            length = rng.expovariate(1 / mean_burst)
+        else:
+            length = scale * rng.paretovariate(alpha)
+        priority = levels[min(bisect(totals, rng.random() * totals[-1]), len(levels) - 1)]
+        yield f"P{i}", int(t), max(1, round(length)), priority
+
+
+def generate_workload(n, seed=None, **options):
+    """ProcessTable of n seeded processes; options are those of workload_rows()."""
+    table = ProcessTable()
+    for row in workload_rows(n, seed, **options):
+        table.append(*row)
+    return table
+
+
+def _check_trace(n, pages):
+    if n < 0 or pages <= 0:
+        raise ValueError("Reference count must not be negative and page count must be positive.")
+
+
+def zipf_references(n, pages, seed=None, exponent=1.0):
+    """Pages 0..pages-1 drawn with probability proportional to 1 / (page + 1) ** exponent."""
+    _check_trace(n, pages)
+    totals = array('d', accumulate(1 / (k + 1) ** exponent for k in range(pages)))
+    draw, last, top = random.Random(seed).random, totals[-1], pages - 1
+    for _ in range(n):
+        # Rounding can put a draw at the very top of the last bucket
+        yield min(bisect(totals, draw() * last), top)
+
+
+def loop_references(n, pages, seed=None, noise=0.0):
+    """Sweep 0..pages-1 over and over, the case that defeats LRU and FIFO.
+
+    With 'noise' > 0 that fraction of references goes to a random page instead.
+    """
+    _check_trace(n, pages)
+    rng = random.Random(seed)
+    for step in range(n):
+        if noise and rng.random() < noise:
+            yield rng.randrange(pages)
+        else:
+            yield step % pages
+
+
+def phase_references(n, pages, seed=None, set_size=None, phase_length=10000):
+    """Uniform references within a random set that is replaced every phase_length steps."""
+    _check_trace(n, pages)
+    set_size = set_size or max(1, pages // 10)
+    if not 0 < set_size <= pages or phase_length <= 0:
+        raise ValueError("Set size must be between 1 and the page count; phase length must be positive.")
+    rng = random.Random(seed)
+    draw = rng.random
+    for start in range(0, n, phase_length):
+        members = rng.sample(range(pages), set_size)
+        for _ in range(min(phase_length, n - start)):
+            yield members[int(draw() * set_size)]
+
+
+def working_set_references(n, pages, seed=None, set_size=None, locality=0.9):
+    """References that stay in a drifting working set.
+
+    With probability 'locality' a reference goes to a current member; otherwise
+    it goes to a random page, which then replaces a random member so the set
+    slowly moves through the address space.
+    """
+    _check_trace(n, pages)
+    set_size = set_size or max(1, pages // 10)
+    if not 0 < set_size <= pages or not 0 <= locality <= 1:
+        raise ValueError("Set size must be between 1 and the page count; locality must be in [0, 1].")
+    rng = random.Random(seed)
+    draw = rng.random
+    members = rng.sample(range(pages), set_size)
+    resident = set(members)
+    for _ in range(n):
+        if draw() < locality:
+            yield members[int(draw() * set_size)]
+            continue
+        page = rng.randrange(pages)
+        if page not in resident:
+            slot = rng.randrange(set_size)
+            resident.discard(members[slot])
+            resident.add(page)
+            members[slot] = page
+        yield page
+
+
+TRACE_MODELS = {
+    "zipf": zipf_references,
+    "loop": loop_references,
+    "phase": phase_references,
+    "working-set": working_set_references,
+}
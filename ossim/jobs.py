@@ -0,0 +1,89 @@
+"""Batches of independent jobs that a GUI can drive from its event loop."""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def pool_size(workers, jobs):
+    # Worker processes worth starting for this many jobs
+    return min(workers or os.cpu_count() or 1, jobs)
+
+
+class JobBatch:
+    """One job per key, run concurrently in a process pool or here, one per poll().
+
+    Subclasses call _start() with their keys and define _submit(key), which
+    hands a job to self.pool, and _run(key), which runs it in this process;
+    _store(key, result) may merge each result as it arrives.
+    poll() never blocks on a running worker, so a GUI can call it from its event
+    loop; iterating blocks and yields results as they finish. Both give
+    (key, result) pairs. _drop(keep) lets a subclass skip queued jobs once the
+    results in hand make them moot. Call close() when done.
+    """
+
+    pool = None
+
+    def _start(self, keys, workers=1, initializer=None, initargs=()):
+        if workers > 1:
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+            self.pending = {self._submit(key): key for key in keys}
+        else:
+            self.pending = deque(keys)
+
+    def _submit(self, key):
+        raise NotImplementedError
+
+    def _run(self, key):
+        raise NotImplementedError
+
+    def _store(self, key, result):
+        # Merge one finished job into whatever the subclass collects
+        pass
+
+    def _release(self):
+        # Free whatever the jobs shared once they are over
+        pass
+
+    def _drop(self, keep):
+        # Forget the jobs not yet started whose keys fail keep(key)
+        if self.pool is None:
+            self.pending = deque(filter(keep, self.pending))
+            return
+        for future, key in list(self.pending.items()):
+            if not keep(key) and future.cancel():
+                del self.pending[future]
+
+    def done(self):
+        return not self.pending
+
+    def poll(self):
+        if self.pool is None:
+            if not self.pending:
+                return []
+            key = self.pending.popleft()
+            return [self._finish(key, self._run(key))]
+        finished = [future for future in self.pending if future.done()]
+        return [self._finish(self.pending.pop(future), future.result()) for future in finished]
+
+    def __iter__(self):
+        if self.pool is None:
+            while self.pending:
+                yield from self.poll()
+            return
+        for future in as_completed(list(self.pending)):
+            if future not in self.pending:
+                # Dropped while waiting
+                continue
+            yield self._finish(self.pending.pop(future), future.result())
+
+    def _finish(self, key, result):
+        self._store(key, result)
+        return key, result
+
+    def close(self):
+        if self.pool is not None:
+            # Do not wait on a job still running after an error; it finishes on its own
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        self.pending = {}
+        self._release()
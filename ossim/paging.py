@@ -0,0 +1,909 @@
+import heapq
+from array import array
+from collections import OrderedDict, deque
+
+from ossim.jobs import JobBatch, pool_size
+from ossim.traces import PageTrace
+
+
+HISTORY_LEVELS = ("full", "faults", "none")
+
+
+class PageHistory:
+    """Delta-encoded trace of a page replacement run.
+
+    Each record keeps only the page, the frame slot it was loaded into (-1 for a
+    hit) and the page it evicted (-1 when it filled an empty frame). Frame
+    snapshots are rebuilt on demand from periodic checkpoints, so indexing and
+    iterating still yield (page, memory, is_fault) like the old list of copies.
+    At the "faults" level hits are not recorded and steps holds the reference
+    index of every record.
+    """
+
+    def __init__(self, frames, level="full"):
+        if level not in ("full", "faults"):
+            raise ValueError(f"Unknown history level: {level}")
+        self.frames, self.level = frames, level
+        self.pages, self.slots, self.victims = array('q'), array('i'), array('q')
+        self.steps = array('q') if level == "faults" else None
+        # A checkpoint every 'interval' records bounds rebuild cost to one
+        # interval while keeping checkpoint storage under a quarter slot per record
+        self.interval = max(256, 4 * frames)
+        self.checkpoints = [()]
+        self._live = []
+        self._cursor = None
+
+    @classmethod
+    def for_level(cls, frames, level):
+        # None means the caller should not record anything
+        if level == "none":
+            return None
+        return cls(frames, level)
+
+    def __len__(self):
+        return len(self.pages)
+
+    def hit(self, step, page):
+        if self.steps is None:
+            self._append(step, page, -1, -1)
+
+    def fault(self, step, page, slot, victim=-1):
+        live = self._live
+        if slot == len(live):
+            live.append(page)
+        else:
+            live[slot] = page
+        self._append(step, page, slot, victim)
+
+    def _append(self, step, page, slot, victim):
+        self.pages.append(page)
+        self.slots.append(slot)
+        self.victims.append(victim)
+        if self.steps is not None:
+            self.steps.append(step)
+        if len(self.pages) % self.interval == 0:
+            self.checkpoints.append(tuple(self._live))
+
+    def _replay(self, memory, start, stop):
+        # Apply records start..stop-1 to 'memory' in place
+        pages, slots = self.pages, self.slots
+        for k in range(start, stop):
+            slot = slots[k]
+            if slot == len(memory):
+                memory.append(pages[k])
+            elif slot >= 0:
+                memory[slot] = pages[k]
+        return memory
+
+    def snapshot(self, i):
+        """Frame contents right after record i."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("history index out of range")
+        # Sequential readers such as the trace animator only replay the gap
+        # since the previous call
+        if self._cursor is not None and 0 <= i - self._cursor[0] < self.interval:
+            last, memory = self._cursor
+            self._replay(memory, last + 1, i + 1)
+        else:
+            base = (i + 1) // self.interval
+            memory = self._replay(list(self.checkpoints[base]), base * self.interval, i + 1)
+        self._cursor = (i, memory)
+        return list(memory)
+
+    def __getitem__(self, i):
+        memory = self.snapshot(i)
+        return self.pages[i], memory, self.slots[i] >= 0
+
+    def __iter__(self):
+        memory = []
+        for k in range(len(self)):
+            self._replay(memory, k, k + 1)
+            yield self.pages[k], list(memory), self.slots[k] >= 0
+
+    def fault_count(self):
+        if self.steps is not None:
+            return len(self)
+        return sum(1 for slot in self.slots if slot >= 0)
+
+
+def fifo_page_replacement(pages, frames, record="full"):
+    # Frames fill in order and are then reused round-robin, so the oldest page
+    # is always at 'hand' and is overwritten in place
+    history = PageHistory.for_level(frames, record)
+    if history is None:
+        return fifo_fault_count(pages, frames), None
+    memory, resident, faults, hand = [], set(), 0, 0
+    for step, page in enumerate(pages):
+        if page in resident:
+            history.hit(step, page)
+            continue
+        faults += 1
+        if len(memory) < frames:
+            history.fault(step, page, len(memory))
+            memory.append(page)
+        else:
+            victim = memory[hand]
+            resident.discard(victim)
+            memory[hand] = page
+            history.fault(step, page, hand, victim)
+            hand = (hand + 1) % frames
+        resident.add(page)
+    return faults, history
+
+
+def fifo_fault_count(pages, frames):
+    # Same policy as fifo_page_replacement without the per-step snapshots: the
+    # queue gives eviction order and the set gives O(1) residency checks
+    queue, resident, faults = deque(), set(), 0
+    for page in pages:
+        if page not in resident:
+            faults += 1
+            if len(queue) == frames:
+                resident.discard(queue.popleft())
+            queue.append(page)
+            resident.add(page)
+    return faults
+
+
+# Worker-side reference string, set up once per process by the pool
+# initializer rather than once per task. A mapped trace stays open for the
+# life of the worker.
+_worker_pages = _worker_trace = None
+
+
+def _init_pages_worker(source):
+    global _worker_pages, _worker_trace
+    if isinstance(source, str):
+        _worker_trace = PageTrace(source)
+        source = _worker_trace.pages
+    _worker_pages = source
+
+
+def _local_pages(pages):
+    # The jobs below take a PageTrace in place of its pages
+    return pages.pages if isinstance(pages, PageTrace) else pages
+
+
+def _worker_source(pages):
+    # What each worker rebuilds the pages from. A PageTrace is reopened there by
+    # path, so workers share the page cache instead of each unpickling a copy;
+    # anything else is copied compactly, a bare view as raw bytes
+    if isinstance(pages, PageTrace):
+        return pages.path
+    if isinstance(pages, memoryview):
+        # frombytes() only takes byte views; the cast is released at once so
+        # the trace can still be closed
+        copy = array(pages.format)
+        with pages.cast('B') as raw:
+            copy.frombytes(raw)
+        return copy
+    return array('q', pages)
+
+
+# Below this many page references in total (len(pages) * max_frames), starting
+# worker processes costs more than the sweep itself
+SWEEP_PARALLEL_MIN = 2_000_000
+
+
+def fifo_frame_sweep(pages, max_frames=None, workers=None):
+    """FIFO page faults for every frame count 1..max_frames.
+
+    FIFO is not a stack algorithm, so each frame count is simulated on its own,
+    as a FaultCurveSweep job that big traces spread across a process pool;
+    'pages' may be a PageTrace, as there. Element k of the result is the
+    fault count with k + 1 frames.
+    """
+    if max_frames is None:
+        max_frames = len(set(_local_pages(pages)))
+    job = FaultCurveSweep(pages, max_frames, ("FIFO",), workers)
+    try:
+        for _ in job:
+            pass
+    finally:
+        job.close()
+    return job.curves["FIFO"]
+
+
+def belady_anomalies(faults):
+    # Frame counts (1-based, as in the sweep) that fault more than one frame fewer
+    return [k + 1 for k in range(1, len(faults)) if faults[k] > faults[k - 1]]
+
+
+def lru_page_replacement(pages, frames, record="full"):
+    # 'recent' is ordered from least to most recently used and 'slot' maps each
+    # resident page to its frame, so hits and evictions are O(1)
+    history = PageHistory.for_level(frames, record)
+    memory, faults = [], 0
+    recent, slot = OrderedDict(), {}
+    for step, page in enumerate(pages):
+        if page not in slot:
+            faults += 1
+            victim = -1
+            if len(memory) < frames:
+                slot[page] = len(memory)
+                memory.append(page)
+            else:
+                victim, _ = recent.popitem(last=False)
+                victim_index = slot.pop(victim)
+                memory[victim_index] = page
+                slot[page] = victim_index
+            recent[page] = None
+            if history is not None:
+                history.fault(step, page, slot[page], victim)
+        else:
+            recent.move_to_end(page)
+            if history is not None:
+                history.hit(step, page)
+    return faults, history
+
+
+def next_use_index(pages):
+    # One backward pass: entry i is the position of the next reference to pages[i],
+    # or len(pages) if the page is never referenced again
+    n = len(pages)
+    upcoming, seen = array('q', bytes(8 * n)), {}
+    for i in range(n - 1, -1, -1):
+        upcoming[i] = seen.get(pages[i], n)
+        seen[pages[i]] = i
+    return upcoming
+
+
+class OptimalPolicy:
+    def __init__(self, frames, next_use):
+        # Resident pages sit in a max-heap on their next use. A hit pushes a fresh
+        # entry instead of updating in place, and outdated entries are skipped when
+        # popped, which keeps every reference at O(log frames). Unlike the other
+        # policies it needs next_use_index() of the whole trace up front.
+        self.frames, self.next_use, self.step = frames, next_use, 0
+        self.memory, self.slot, self.due, self.heap = [], {}, {}, []
+
+    def access(self, page):
+        i, memory, slot, due = self.step, self.memory, self.slot, self.due
+        self.step = i + 1
+        event = None
+        if page not in slot:
+            victim = -1
+            if len(memory) < self.frames:
+                slot[page] = len(memory)
+                memory.append(page)
+            else:
+                heap = self.heap
+                while True:
+                    neg_due, victim_index, victim = heapq.heappop(heap)
+                    if memory[victim_index] == victim and due[victim] == -neg_due:
+                        break
+                del slot[victim], due[victim]
+                memory[victim_index] = page
+                slot[page] = victim_index
+            event = slot[page], victim
+
+        # Ties (pages never used again) go to the lowest frame slot
+        due[page] = self.next_use[i]
+        heapq.heappush(self.heap, (-due[page], slot[page], page))
+        if len(self.heap) > 2 * self.frames + 64:
+            self.heap = [(-due[p], j, p) for j, p in enumerate(memory)]
+            heapq.heapify(self.heap)
+        return event
+
+
+def optimal_page_replacement(pages, frames, record="full"):
+    return _run_policy(OptimalPolicy(frames, next_use_index(pages)), pages, record)
+
+
+class FenwickTree:
+    """Binary indexed tree over positions 0..n-1 with point add and prefix sums."""
+
+    def __init__(self, n):
+        self.tree = array('q', bytes(8 * (n + 1)))
+
+    def add(self, i, delta):
+        tree, i = self.tree, i + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        # Sum of positions 0..i (inclusive); prefix(-1) is 0
+        tree, i, total = self.tree, i + 1, 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+def _faults_from_distances(hist, cold, max_frames):
+    # hist[d] counts re-references at stack distance d (index max_frames + 1 holds
+    # everything deeper); with F frames, every reference deeper than F faults
+    faults, deeper = [], sum(hist[1:])
+    for f in range(1, max_frames + 1):
+        deeper -= hist[f]
+        faults.append(cold + deeper)
+    return faults
+
+
+def lru_stack_distances(pages, max_frames):
+    # Mattson stack distance: a re-reference to a page last seen at t has distance
+    # 1 + (distinct pages referenced since t). The tree keeps a 1 at the latest
+    # reference of every page, so that count is a range sum: O(n log n) overall.
+    n = len(pages)
+    tree, last = FenwickTree(n), {}
+    hist, cold = [0] * (max_frames + 2), 0
+    for i, page in enumerate(pages):
+        t = last.get(page)
+        if t is None:
+            cold += 1
+        else:
+            distance = tree.prefix(i - 1) - tree.prefix(t) + 1
+            hist[min(distance, max_frames + 1)] += 1
+            tree.add(t, -1)
+        tree.add(i, 1)
+        last[page] = i
+    return hist, cold
+
+
+def opt_stack_distances(pages, max_frames):
+    # Mattson's priority stack for OPT: the referenced page moves to the top and the
+    # pages above its old position are re-sorted by bubbling the one with the
+    # farthest next use downwards. Only the top max_frames entries can affect the
+    # curve, so each reference costs O(min(depth, max_frames)).
+    next_use = next_use_index(pages)
+    stack, due = [], {}
+    hist, cold = [0] * (max_frames + 2), 0
+    for i, page in enumerate(pages):
+        try:
+            depth = stack.index(page)
+            hist[depth + 1] += 1
+        except ValueError:
+            if page in due:
+                hist[max_frames + 1] += 1
+            else:
+                cold += 1
+            # Enter at the bottom, then move up like any other reference
+            stack.append(page)
+            depth = len(stack) - 1
+        due[page] = next_use[i]
+        if depth:
+            carry, stack[0] = stack[0], page
+            for j in range(1, depth):
+                if due[stack[j]] > due[carry]:
+                    carry, stack[j] = stack[j], carry
+            stack[depth] = carry
+        if len(stack) > max_frames:
+            stack.pop()
+    return hist, cold
+
+
+def miss_ratio_curve(pages, algo="LRU", max_frames=None):
+    """Page faults for every frame count 1..max_frames from a single pass.
+
+    LRU and OPT are stack algorithms, so one stack-distance pass covers every
+    cache size at once. Element k of the result is the fault count with k + 1
+    frames; divide by len(pages) for the miss ratio.
+    """
+    if max_frames is None:
+        max_frames = len(set(pages))
+    max_frames = max(1, max_frames)
+    if algo == "LRU":
+        hist, cold = lru_stack_distances(pages, max_frames)
+    elif algo == "Optimal":
+        hist, cold = opt_stack_distances(pages, max_frames)
+    else:
+        raise ValueError(f"{algo} is not a stack algorithm.")
+    return _faults_from_distances(hist, cold, max_frames)
+
+
+def _fault_curve(pages, algo, frames):
+    # The whole curve for a stack algorithm, one fault count for FIFO
+    if algo == "FIFO":
+        return fifo_fault_count(pages, frames)
+    return miss_ratio_curve(pages, algo, frames)
+
+
+def _fault_curve_task(algo, frames):
+    return _fault_curve(_worker_pages, algo, frames)
+
+
+class FaultCurveSweep(JobBatch):
+    """FIFO and Optimal page faults for every frame count 1..max_frames, LRU's
+    for every count up to the number of distinct pages.
+
+    LRU and Optimal take one stack-distance pass each and FIFO one run per
+    frame count, each a separate job. LRU's pass costs the same at any size,
+    so it goes all the way; once it is in, the other curves are cut at the
+    number of distinct pages, past which every curve is flat. Big traces run
+    the jobs in a process pool; small ones run here, one job per poll().
+    'pages' may be a PageTrace, which the workers then reopen by path rather
+    than each receiving a copy. Polled or iterated like any JobBatch; 'curves'
+    maps each algorithm to its curve once done(). Call close() when done.
+    """
+
+    def __init__(self, pages, max_frames, algos=("FIFO", "LRU", "Optimal"), workers=None):
+        self.max_frames = max(1, max_frames)
+        self.curves = {algo: None for algo in algos}
+        # The Optimal pass is the longest, so it starts first
+        keys = [("Optimal", self.max_frames)] if "Optimal" in self.curves else []
+        if "LRU" in self.curves:
+            keys.append(("LRU", None))
+        if "FIFO" in self.curves:
+            self.curves["FIFO"] = array('q', bytes(8 * self.max_frames))
+            keys += [("FIFO", f) for f in range(1, self.max_frames + 1)]
+        self.pages = _local_pages(pages)
+        workers = pool_size(workers, len(keys))
+        if workers > 1 and len(pages) * self.max_frames >= SWEEP_PARALLEL_MIN:
+            self._start(keys, workers, _init_pages_worker, (_worker_source(pages),))
+        else:
+            self._start(keys)
+
+    def _submit(self, key):
+        return self.pool.submit(_fault_curve_task, *key)
+
+    def _run(self, key):
+        return _fault_curve(self.pages, *key)
+
+    def _store(self, key, result):
+        algo, frames = key
+        if algo == "FIFO":
+            # A run already under way when its frame count was cut is ignored
+            if frames <= len(self.curves[algo]):
+                self.curves[algo][frames - 1] = result
+            return
+        self.curves[algo] = result
+        distinct = len(self.curves.get("LRU") or ()) or self.max_frames
+        if distinct < self.max_frames:
+            for algo in ("Optimal", "FIFO"):
+                if self.curves.get(algo) is not None:
+                    del self.curves[algo][distinct:]
+            self._drop(lambda key: key[0] != "FIFO" or key[1] <= distinct)
+
+    def _release(self):
+        self.pages = None
+
+
+# Streaming policies: each keeps only its frames and per-frame bookkeeping, and
+# access() returns None on a hit or (slot, victim) on a fault, victim being -1
+# when an empty frame was filled. They work on any iterable of page numbers.
+class FIFOPolicy:
+    def __init__(self, frames):
+        self.frames, self.memory, self.slot, self.hand = frames, [], {}, 0
+
+    def access(self, page):
+        if page in self.slot:
+            return None
+        memory = self.memory
+        if len(memory) < self.frames:
+            self.slot[page] = len(memory)
+            memory.append(page)
+            return len(memory) - 1, -1
+        hand = self.hand
+        victim = memory[hand]
+        del self.slot[victim]
+        memory[hand], self.slot[page] = page, hand
+        self.hand = (hand + 1) % self.frames
+        return hand, victim
+
+
+class LRUPolicy:
+    def __init__(self, frames):
+        # 'recent' maps resident pages to their slot, least recently used first
+        self.frames, self.memory, self.recent = frames, [], OrderedDict()
+
+    def access(self, page):
+        recent = self.recent
+        if page in recent:
+            recent.move_to_end(page)
+            return None
+        memory = self.memory
+        if len(memory) < self.frames:
+            recent[page] = len(memory)
+            memory.append(page)
+            return len(memory) - 1, -1
+        victim, index = recent.popitem(last=False)
+        memory[index], recent[page] = page, index
+        return index, victim
+
+
+class ClockPolicy:
+    def __init__(self, frames):
+        # One reference bit per frame; the hand sweeps past set bits, clearing
+        # them, and evicts the first page whose bit is already clear
+        self.frames, self.memory, self.slot, self.hand = frames, [], {}, 0
+        self.referenced = bytearray(frames)
+
+    def access(self, page):
+        index = self.slot.get(page)
+        if index is not None:
+            self.referenced[index] = 1
+            return None
+        memory, referenced = self.memory, self.referenced
+        if len(memory) < self.frames:
+            index = len(memory)
+            memory.append(page)
+            self.slot[page], referenced[index] = index, 1
+            return index, -1
+        hand = self.hand
+        while referenced[hand]:
+            referenced[hand] = 0
+            hand = (hand + 1) % self.frames
+        victim = memory[hand]
+        del self.slot[victim]
+        memory[hand], self.slot[page], referenced[hand] = page, hand, 1
+        self.hand = (hand + 1) % self.frames
+        return hand, victim
+
+
+class SecondChancePolicy:
+    def __init__(self, frames):
+        # Resident pages in load order. A page referenced since it was queued
+        # is moved to the back with its bit cleared instead of being evicted;
+        # unlike Clock, a freshly loaded page starts without that chance.
+        self.frames, self.memory, self.slot = frames, [], {}
+        self.queue, self.referenced = deque(), {}
+
+    def access(self, page):
+        if page in self.slot:
+            self.referenced[page] = True
+            return None
+        memory, queue, referenced = self.memory, self.queue, self.referenced
+        victim = -1
+        if len(memory) < self.frames:
+            index = len(memory)
+            memory.append(page)
+        else:
+            while referenced[queue[0]]:
+                referenced[queue[0]] = False
+                queue.rotate(-1)
+            victim = queue.popleft()
+            del referenced[victim]
+            index = self.slot.pop(victim)
+            memory[index] = page
+        queue.append(page)
+        self.slot[page], referenced[page] = index, False
+        return index, victim
+
+
+class LFUPolicy:
+    def __init__(self, frames):
+        # Pages are bucketed by reference count; each bucket is kept in LRU
+        # order so ties go to the least recently used page. 'min_count' names
+        # the lowest non-empty bucket, making every reference O(1).
+        self.frames, self.memory, self.slot = frames, [], {}
+        self.count, self.buckets, self.min_count = {}, {}, 0
+
+    def _bump(self, page, count):
+        self.count[page] = count
+        self.buckets.setdefault(count, OrderedDict())[page] = None
+
+    def access(self, page):
+        count = self.count.get(page)
+        if count is not None:
+            bucket = self.buckets[count]
+            del bucket[page]
+            if not bucket:
+                del self.buckets[count]
+                if self.min_count == count:
+                    self.min_count = count + 1
+            self._bump(page, count + 1)
+            return None
+        memory, victim = self.memory, -1
+        if len(memory) < self.frames:
+            index = len(memory)
+            memory.append(page)
+        else:
+            bucket = self.buckets[self.min_count]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self.buckets[self.min_count]
+            del self.count[victim]
+            index = self.slot.pop(victim)
+            memory[index] = page
+        self.slot[page], self.min_count = index, 1
+        self._bump(page, 1)
+        return index, victim
+
+
+class ARCPolicy:
+    def __init__(self, frames):
+        # Adaptive Replacement Cache (Megiddo & Modha). t1 holds pages seen once
+        # recently, t2 pages seen at least twice; b1 and b2 are ghost lists of
+        # pages recently evicted from each. Ghost hits move the target size 'p'
+        # of t1, trading recency against frequency; as in the paper, 'p' and its
+        # steps are real-valued. All lists are in LRU order.
+        self.frames, self.memory, self.slot, self.p = frames, [], {}, 0.0
+        self.t1, self.t2, self.b1, self.b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+
+    def _replace(self, in_b2):
+        # Demote the LRU page of t1 or t2 to its ghost list and free its frame
+        t1 = self.t1
+        if t1 and (len(t1) > self.p or (in_b2 and len(t1) == self.p)):
+            victim, _ = t1.popitem(last=False)
+            self.b1[victim] = None
+        else:
+            victim, _ = self.t2.popitem(last=False)
+            self.b2[victim] = None
+        return victim, self.slot.pop(victim)
+
+    def access(self, page):
+        t1, t2, b1, b2, c = self.t1, self.t2, self.b1, self.b2, self.frames
+        if page in t1:
+            del t1[page]
+            t2[page] = None
+            return None
+        if page in t2:
+            t2.move_to_end(page)
+            return None
+
+        victim, index = -1, None
+        if page in b1:
+            self.p = min(c, self.p + max(len(b2) / len(b1), 1))
+            del b1[page]
+            victim, index = self._replace(False)
+            t2[page] = None
+        elif page in b2:
+            self.p = max(0.0, self.p - max(len(b1) / len(b2), 1))
+            del b2[page]
+            victim, index = self._replace(True)
+            t2[page] = None
+        else:
+            if len(t1) + len(b1) == c:
+                if len(t1) < c:
+                    b1.popitem(last=False)
+                    victim, index = self._replace(False)
+                else:
+                    victim, _ = t1.popitem(last=False)
+                    index = self.slot.pop(victim)
+            elif len(t1) + len(t2) == c:
+                if len(t1) + len(t2) + len(b1) + len(b2) == 2 * c:
+                    b2.popitem(last=False)
+                victim, index = self._replace(False)
+            t1[page] = None
+
+        memory = self.memory
+        if index is None:
+            index = len(memory)
+            memory.append(page)
+        else:
+            memory[index] = page
+        self.slot[page] = index
+        return index, victim
+
+
+class TwoQueuePolicy:
+    def __init__(self, frames):
+        # Full 2Q (Johnson & Shasha): first references wait in the FIFO 'a1in';
+        # pages evicted from it are remembered in the ghost FIFO 'a1out', and a
+        # reference that finds its page there promotes it to the LRU list 'am'.
+        self.frames, self.memory, self.slot = frames, [], {}
+        self.a1in, self.a1out, self.am = OrderedDict(), OrderedDict(), OrderedDict()
+        self.in_limit, self.out_limit = max(1, frames // 4), max(1, frames // 2)
+
+    def _reclaim(self):
+        if len(self.memory) < self.frames:
+            self.memory.append(None)
+            return len(self.memory) - 1, -1
+        a1in = self.a1in
+        if len(a1in) > self.in_limit or not self.am:
+            victim, _ = a1in.popitem(last=False)
+            self.a1out[victim] = None
+            if len(self.a1out) > self.out_limit:
+                self.a1out.popitem(last=False)
+        else:
+            victim, _ = self.am.popitem(last=False)
+        return self.slot.pop(victim), victim
+
+    def access(self, page):
+        if page in self.am:
+            self.am.move_to_end(page)
+            return None
+        if page in self.a1in:
+            return None
+        # Decide before reclaiming, which may push this very page out of a1out
+        ghost = page in self.a1out
+        index, victim = self._reclaim()
+        if ghost:
+            self.a1out.pop(page, None)
+            self.am[page] = None
+        else:
+            self.a1in[page] = None
+        self.memory[index], self.slot[page] = page, index
+        return index, victim
+
+
+STREAM_POLICIES = {
+    "FIFO": FIFOPolicy,
+    "LRU": LRUPolicy,
+    "Clock": ClockPolicy,
+    "Second Chance": SecondChancePolicy,
+    "LFU": LFUPolicy,
+    "ARC": ARCPolicy,
+    "2Q": TwoQueuePolicy,
+}
+
+
+def _stream_policy(algo, frames):
+    if algo not in STREAM_POLICIES:
+        raise ValueError(f"{algo} cannot run on a stream (choose from {', '.join(STREAM_POLICIES)}).")
+    if frames <= 0:
+        raise ValueError("Number of frames must be positive.")
+    return STREAM_POLICIES[algo](frames)
+
+
+def stream_faults(pages, frames, algo="FIFO"):
+    """Yield (step, page, slot, victim) for every fault in an iterable of pages."""
+    access = _stream_policy(algo, frames).access
+    for step, page in enumerate(pages):
+        event = access(page)
+        if event is not None:
+            yield step, page, event[0], event[1]
+
+
+def stream_fault_stats(pages, frames, algo="FIFO", window=10000):
+    """Yield (references, window_faults, total_faults) after every window of pages.
+
+    A final shorter window is reported if the stream does not end on a boundary.
+    """
+    access = _stream_policy(algo, frames).access
+    references = window_faults = total_faults = 0
+    for page in pages:
+        references += 1
+        if access(page) is not None:
+            window_faults += 1
+        if references % window == 0:
+            total_faults += window_faults
+            yield references, window_faults, total_faults
+            window_faults = 0
+    if references % window:
+        yield references, window_faults, total_faults + window_faults
+
+
+def _run_policy(policy, pages, record):
+    # Drive a streaming policy over a whole reference string, recording history
+    history = PageHistory.for_level(policy.frames, record)
+    access, faults = policy.access, 0
+    for step, page in enumerate(pages):
+        event = access(page)
+        if event is None:
+            if history is not None:
+                history.hit(step, page)
+        else:
+            faults += 1
+            if history is not None:
+                history.fault(step, page, event[0], event[1])
+    return faults, history
+
+
+def clock_page_replacement(pages, frames, record="full"):
+    return _run_policy(ClockPolicy(frames), pages, record)
+
+
+def second_chance_page_replacement(pages, frames, record="full"):
+    return _run_policy(SecondChancePolicy(frames), pages, record)
+
+
+def lfu_page_replacement(pages, frames, record="full"):
+    return _run_policy(LFUPolicy(frames), pages, record)
+
+
+def arc_page_replacement(pages, frames, record="full"):
+    return _run_policy(ARCPolicy(frames), pages, record)
+
+
+def two_queue_page_replacement(pages, frames, record="full"):
+    return _run_policy(TwoQueuePolicy(frames), pages, record)
+
+
+MEMORY_ALGORITHMS = {
+    "FIFO": fifo_page_replacement,
+    "LRU": lru_page_replacement,
+    "Optimal": optimal_page_replacement,
+    "Clock": clock_page_replacement,
+    "Second Chance": second_chance_page_replacement,
+    "LFU": lfu_page_replacement,
+    "ARC": arc_page_replacement,
+    "2Q": two_queue_page_replacement,
+}
+
+def _make_policy(algo, frames, pages):
+    if algo == "Optimal":
+        return OptimalPolicy(frames, next_use_index(pages))
+    return _stream_policy(algo, frames)
+
+
+def _compare_pass(pages, frames, algos, window):
+    # One pass over the trace, every policy seeing each page in turn
+    accesses = [_make_policy(algo, frames, pages).access for algo in algos]
+    faults = [0] * len(algos)
+    curves = [array('q') for _ in algos]
+    references = 0
+    for page in pages:
+        references += 1
+        for j, access in enumerate(accesses):
+            if access(page) is not None:
+                faults[j] += 1
+        if references % window == 0:
+            for j in range(len(algos)):
+                curves[j].append(faults[j])
+    if references % window:
+        for j in range(len(algos)):
+            curves[j].append(faults[j])
+    return {algo: (faults[j], curves[j]) for j, algo in enumerate(algos)}
+
+
+def _compare_worker(algos, frames, window):
+    return _compare_pass(_worker_pages, frames, algos, window)
+
+
+# Below this many policy steps (len(pages) * policies) the lock-step pass in
+# this process is faster than shipping the trace to workers
+COMPARE_PARALLEL_MIN = 4_000_000
+
+
+class PolicyComparison(JobBatch):
+    """Run several page replacement policies over one trace, each group a job.
+
+    Big traces are split by policy across a process pool, each worker feeding
+    its group of policies in lock-step from one pass; small ones run here, one
+    policy per poll(). 'pages' may be a PageTrace, which the workers then
+    reopen by path rather than each receiving a copy. Polled or iterated like
+    any JobBatch; results() gives the comparison once done(). Call close()
+    when done.
+    """
+
+    def __init__(self, pages, frames, algos=None, window=None, workers=None):
+        self.algos = list(algos or MEMORY_ALGORITHMS)
+        for algo in self.algos:
+            if algo not in MEMORY_ALGORITHMS:
+                raise ValueError(f"Unknown page replacement algorithm: {algo}")
+        if frames <= 0:
+            raise ValueError("Number of frames must be positive.")
+        self.pages, self.frames, self.references = _local_pages(pages), frames, len(pages)
+        self.window = window or max(1, self.references // 200)
+        self.raw = {}
+        workers = pool_size(workers, len(self.algos))
+        if workers > 1 and self.references * len(self.algos) >= COMPARE_PARALLEL_MIN:
+            groups = [tuple(self.algos[w::workers]) for w in range(workers)]
+            self._start(groups, workers, _init_pages_worker, (_worker_source(pages),))
+        else:
+            self._start([(algo,) for algo in self.algos])
+
+    def _submit(self, group):
+        return self.pool.submit(_compare_worker, group, self.frames, self.window)
+
+    def _run(self, group):
+        return _compare_pass(self.pages, self.frames, group, self.window)
+
+    def _store(self, group, result):
+        self.raw.update(result)
+
+    def _release(self):
+        self.pages = None
+
+    def results(self):
+        """{algo: {"faults", "hit_ratio", "steps", "curve"}}, where curve[k] is the
+        cumulative fault count after steps[k] references."""
+        n, window = self.references, self.window
+        steps = array('q', range(window, n + 1, window))
+        if n % window:
+            steps.append(n)
+        return {algo: {"faults": self.raw[algo][0],
+                       "hit_ratio": (n - self.raw[algo][0]) / n if n else 0.0,
+                       "steps": steps,
+                       "curve": self.raw[algo][1]} for algo in self.algos}
+
+
+def compare_policies(pages, frames, algos=None, window=None, workers=None):
+    """Run several page replacement policies over one trace and compare them.
+
+    Drains a PolicyComparison, so big traces are split by policy across worker
+    processes and 'pages' may be a PageTrace. Returns {algo: {"faults",
+    "hit_ratio", "steps", "curve"}}, where curve[k] is the cumulative fault
+    count after steps[k] references.
+    """
+    job = PolicyComparison(pages, frames, algos, window, workers)
+    try:
+        for _ in job:
+            pass
+    finally:
+        job.close()
+    return job.results()
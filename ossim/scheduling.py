@@ -0,0 +1,760 @@
+import heapq
+import pickle
+from array import array
+from collections import deque
+from multiprocessing import shared_memory
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; engines fall back to pure Python
+    np = None
+
+from ossim.jobs import JobBatch, pool_size
+
+
+class ProcessTable:
+    """Column-oriented workload: one typed array per field plus a pid -> row index.
+
+    Scheduling engines only read the table, so a single instance can be shared by
+    every algorithm without copying. Engines return (gantt, waiting, turnaround)
+    where waiting and turnaround are arrays indexed by row.
+    """
+
+    def __init__(self, pids=(), arrival=(), burst=(), priority=()):
+        self.pids = list(pids)
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        self.priority = array('q', priority) if priority else array('q', [1] * len(self.pids))
+        if not len(self.pids) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("Process table columns must all have the same length.")
+        self.index = {pid: row for row, pid in enumerate(self.pids)}
+        self._order = None
+
+    @classmethod
+    def from_dicts(cls, processes):
+        return cls([p['pid'] for p in processes],
+                   [p['arrival'] for p in processes],
+                   [p['burst'] for p in processes],
+                   [p.get('priority', 1) for p in processes])
+
+    def __len__(self):
+        return len(self.pids)
+
+    def append(self, pid, arrival, burst, priority=1):
+        self.index[pid] = len(self.pids)
+        self.pids.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+        self._order = None
+
+    def arrival_order(self):
+        # Rows sorted by arrival; ties keep row order, like list.sort on the dicts did
+        if self._order is None:
+            self._order = array('q', sorted(range(len(self.pids)), key=self.arrival.__getitem__))
+        return self._order
+
+    def take(self, rows):
+        return ProcessTable([self.pids[r] for r in rows], [self.arrival[r] for r in rows],
+                            [self.burst[r] for r in rows], [self.priority[r] for r in rows])
+
+    def to_shared(self):
+        """Copy the table into a new shared memory block for worker processes.
+
+        Layout: row count and pickled-pid length, then the arrival, burst,
+        priority and arrival-order columns as int64, then the pickled pids. The
+        caller owns the block and must close() and unlink() it.
+        """
+        n, names = len(self.pids), pickle.dumps(self.pids)
+        columns = 16 + 32 * n
+        block = shared_memory.SharedMemory(create=True, size=columns + len(names))
+        view = block.buf[:columns].cast('q')
+        view[0], view[1] = n, len(names)
+        for k, column in enumerate((self.arrival, self.burst, self.priority, self.arrival_order())):
+            view[2 + k * n:2 + (k + 1) * n] = column
+        view.release()
+        block.buf[columns:columns + len(names)] = names
+        return block
+
+    @classmethod
+    def from_shared(cls, block):
+        """Read-only table whose columns are views into a to_shared() block."""
+        header = block.buf[:16].cast('q')
+        n, size = header[0], header[1]
+        header.release()
+        columns = block.buf[16:16 + 32 * n].cast('q')
+        table = cls.__new__(cls)
+        table.arrival, table.burst, table.priority, table._order = (columns[k * n:(k + 1) * n] for k in range(4))
+        table.pids = pickle.loads(block.buf[16 + 32 * n:16 + 32 * n + size])
+        table.index = {pid: row for row, pid in enumerate(table.pids)}
+        return table
+
+    def to_dicts(self, waiting=None, turnaround=None, rows=None):
+        """Adapter for code that still works on one dict per process."""
+        out = []
+        for r in (range(len(self.pids)) if rows is None else rows):
+            p = {'pid': self.pids[r], 'arrival': self.arrival[r], 'burst': self.burst[r], 'priority': self.priority[r]}
+            if waiting is not None:
+                p['waiting'] = int(waiting[r])
+                p['turnaround'] = int(turnaround[r])
+            out.append(p)
+        return out
+
+
+def parse_workload(lines):
+    """Build a ProcessTable from "PID Arrival Burst [Priority]" lines.
+
+    Blank lines and lines starting with '#' are skipped.
+    """
+    table = ProcessTable()
+    for line in lines:
+        parts = line.split()
+        if not parts or parts[0].startswith('#'):
+            continue
+        if len(parts) < 3:
+            raise ValueError("Each line must have PID Arrival Burst [Priority].")
+        pid, arr, burst = parts[0], int(parts[1]), int(parts[2])
+        priority = int(parts[3]) if len(parts) > 3 else 1
+        if arr < 0 or burst <= 0:
+            raise ValueError(f"{pid}: arrival must not be negative and burst must be positive.")
+        table.append(pid, arr, burst, priority)
+
+    if not len(table):
+        raise ValueError("No valid processes entered.")
+    return table
+
+
+def _new_metrics(n):
+    return array('q', bytes(8 * n)), array('q', bytes(8 * n))
+
+
+def _annotate(processes, waiting, turnaround, by_arrival=True):
+    # Dict adapter: write the engine's metrics back onto the caller's dicts
+    for row, p in enumerate(processes):
+        p['waiting'] = int(waiting[row])
+        p['turnaround'] = int(turnaround[row])
+    if by_arrival:
+        processes.sort(key=lambda x: x['arrival'])
+    return processes
+
+
+class LazyGantt:
+    """Read-only gantt sequence backed by start/finish arrays.
+
+    Behaves like the usual list of (pid, start, end) tuples, but a tuple is only
+    built when an entry is actually read, e.g. while a chart is being drawn.
+    """
+
+    def __init__(self, pids, rows, start, finish):
+        self.pids, self.rows, self.start, self.finish = pids, rows, start, finish
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        return (self.pids[self.rows[k]], int(self.start[k]), int(self.finish[k]))
+
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+    @property
+    def end(self):
+        return int(self.finish[-1]) if len(self) else 0
+
+
+def gantt_end(gantt):
+    if isinstance(gantt, LazyGantt):
+        return gantt.end
+    return max((entry[2] for entry in gantt), default=0)
+
+
+# Below this size NumPy's call overhead outweighs the vectorised loop
+FCFS_VECTOR_MIN = 256
+
+
+def fcfs_engine(table):
+    if np is not None and len(table) >= FCFS_VECTOR_MIN:
+        return _fcfs_vectorized(table)
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    waiting, turnaround = _new_metrics(len(table))
+    time, gantt = 0, []
+    for i in table.arrival_order():
+        if time < arrival[i]:
+            time = arrival[i]
+        start, finish = time, time + burst[i]
+        gantt.append((pids[i], start, finish))
+        time = finish
+        waiting[i] = start - arrival[i]
+        turnaround[i] = finish - arrival[i]
+    return gantt, waiting, turnaround
+
+
+def _fcfs_vectorized(table):
+    # In arrival order finish[k] = max(finish[k-1], a[k]) + b[k]. Unrolling that
+    # recurrence with S = cumsum(b) gives finish[k] = S[k] + max(0, max over j <= k
+    # of a[j] - S[j-1]), i.e. one cumulative max over arrivals shifted by a prefix sum.
+    rows = np.frombuffer(table.arrival_order(), dtype=np.int64)
+    a = np.frombuffer(table.arrival, dtype=np.int64)[rows]
+    b = np.frombuffer(table.burst, dtype=np.int64)[rows]
+    total = np.cumsum(b)
+    finish = total + np.maximum(np.maximum.accumulate(a - (total - b)), 0)
+    start = finish - b
+    waiting = np.empty(len(rows), dtype=np.int64)
+    turnaround = np.empty(len(rows), dtype=np.int64)
+    waiting[rows] = start - a
+    turnaround[rows] = finish - a
+    return LazyGantt(table.pids, rows, start, finish), waiting, turnaround
+
+
+def _nonpreemptive_engine(table, primary, tie_order):
+    # Event-driven: arrivals are consumed through a pointer into the arrival order
+    # and ready processes sit in a min-heap, so idle gaps are skipped in one jump and
+    # the whole run is O(n log n). Heap entries are plain ints, primary * n + tie
+    # rank, which compare much faster than tuples; tie_order lists the rows in
+    # tie-break order and turns a popped key back into a row.
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    tie_rank = array('q', bytes(8 * n))
+    for pos, i in enumerate(tie_order):
+        tie_rank[i] = pos
+    waiting, turnaround = _new_metrics(n)
+    time, gantt, ready, nxt = 0, [], [], 0
+    while nxt < n or ready:
+        if not ready and time < arrival[order[nxt]]:
+            time = arrival[order[nxt]]
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, primary[i] * n + tie_rank[i])
+            nxt += 1
+        i = tie_order[heapq.heappop(ready) % n]
+        start, finish = time, time + burst[i]
+        gantt.append((pids[i], start, finish))
+        time = finish
+        waiting[i] = start - arrival[i]
+        turnaround[i] = finish - arrival[i]
+    return gantt, waiting, turnaround
+
+
+def _priority_tie_order(table):
+    # Equal priorities fall back to (arrival, pid) so the winner is deterministic
+    pids, arrival = table.pids, table.arrival
+    return sorted(range(len(pids)), key=lambda i: (arrival[i], str(pids[i])))
+
+
+def sjf_engine(table):
+    return _nonpreemptive_engine(table, table.burst, table.arrival_order())
+
+
+def priority_engine(table):
+    return _nonpreemptive_engine(table, table.priority, _priority_tie_order(table))
+
+
+def rr_engine(table, quantum):
+    # The ready queue holds row numbers; each process only carries its remaining
+    # burst, and completion is recorded the moment it finishes.
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    remaining = array('q', burst)
+    waiting, turnaround = _new_metrics(n)
+    time, gantt, ready, nxt = 0, [], deque(), 0
+
+    while nxt < n or ready:
+        if not ready and time < arrival[order[nxt]]:
+            time = arrival[order[nxt]]
+        while nxt < n and arrival[order[nxt]] <= time:
+            ready.append(order[nxt])
+            nxt += 1
+
+        i = ready.popleft()
+        run_time = min(quantum, remaining[i])
+        start = time
+        time += run_time
+        remaining[i] -= run_time
+        gantt.append((pids[i], start, time))
+
+        # Processes that arrived while 'i' was running queue ahead of it
+        while nxt < n and arrival[order[nxt]] <= time:
+            ready.append(order[nxt])
+            nxt += 1
+
+        if remaining[i] > 0:
+            ready.append(i)
+        else:
+            turnaround[i] = time - arrival[i]
+            waiting[i] = turnaround[i] - burst[i]
+
+    return gantt, waiting, turnaround
+
+
+def mlfq_engine(table, quanta=(2, 4, 8), allotments=None, boost_interval=None):
+    # quanta[k] is the time slice of level k (level 0 is the highest priority) and
+    # allotments[k] the CPU time a process may use at level k before it is demoted;
+    # by default that is a single full quantum. Every boost_interval time units all
+    # processes return to level 0.
+    levels = len(quanta)
+    if levels == 0 or min(quanta) <= 0:
+        raise ValueError("MLFQ needs at least one level with a positive quantum.")
+    allotments = list(allotments) if allotments else list(quanta)
+    if len(allotments) != levels or min(allotments) <= 0:
+        raise ValueError("MLFQ needs one positive allotment per level.")
+    if boost_interval is not None and boost_interval < 0:
+        raise ValueError("MLFQ boost interval must not be negative.")
+
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    remaining = array('q', burst)
+    waiting, turnaround = _new_metrics(n)
+    level, used, epoch = [0] * n, [0] * n, [0] * n
+    queues = [deque() for _ in range(levels)]
+    # A boost does not walk the queues: it retires them whole into 'boosted', which
+    # is drained as the top level, and stale levels are reset lazily on dispatch.
+    boosted = deque()
+    cur_epoch, next_boost = 0, boost_interval if boost_interval else None
+    time, gantt, nxt, queued = 0, [], 0, 0
+
+    def admit():
+        nonlocal nxt, queued
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            epoch[i] = cur_epoch
+            queues[0].append(i)
+            nxt += 1
+            queued += 1
+
+    while nxt < n or queued:
+        if not queued and time < arrival[order[nxt]]:
+            time = arrival[order[nxt]]
+        if next_boost is not None and time >= next_boost:
+            cur_epoch += 1
+            boosted.extend(q for q in queues if q)
+            queues = [deque() for _ in range(levels)]
+            next_boost = (time // boost_interval + 1) * boost_interval
+        admit()
+
+        if boosted:
+            i = boosted[0].popleft()
+            if not boosted[0]:
+                boosted.popleft()
+        else:
+            i = next(q for q in queues if q).popleft()
+        queued -= 1
+        if epoch[i] != cur_epoch:
+            level[i], used[i], epoch[i] = 0, 0, cur_epoch
+
+        lvl = level[i]
+        end = time + min(quanta[lvl], allotments[lvl] - used[i], remaining[i])
+        # Below the top level a new arrival (which always enters level 0) preempts
+        if lvl > 0 and nxt < n and arrival[order[nxt]] < end:
+            end = arrival[order[nxt]]
+        start, time = time, end
+        remaining[i] -= end - start
+        used[i] += end - start
+        gantt.append((pids[i], start, end))
+        admit()
+
+        if remaining[i] == 0:
+            turnaround[i] = time - arrival[i]
+            waiting[i] = turnaround[i] - burst[i]
+            continue
+        if used[i] >= allotments[lvl]:
+            level[i], used[i] = min(lvl + 1, levels - 1), 0
+        queues[level[i]].append(i)
+        queued += 1
+
+    return gantt, waiting, turnaround
+
+
+def _preemptive_engine(table, rank):
+    # Discrete-event engine shared by SRTF and preemptive Priority. The running
+    # process is only re-evaluated when something arrives or it completes, so the
+    # cost is O((n + preemptions) log n) regardless of the time scale.
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    remaining = array('q', burst)
+    waiting, turnaround = _new_metrics(n)
+    time, gantt, ready, nxt = 0, [], [], 0
+    current, start = None, 0
+
+    def admit():
+        nonlocal nxt
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (rank(i, remaining[i]), arrival[i], nxt, i))
+            nxt += 1
+
+    while nxt < n or ready or current is not None:
+        if current is None:
+            if not ready and time < arrival[order[nxt]]:
+                time = arrival[order[nxt]]
+            admit()
+            entry = heapq.heappop(ready)
+            current, pos, start = entry[-1], entry[-2], time
+
+        finish = time + remaining[current]
+        if nxt < n and arrival[order[nxt]] < finish:
+            # Run up to the next arrival, then see whether it takes the CPU away
+            remaining[current] -= arrival[order[nxt]] - time
+            time = arrival[order[nxt]]
+            admit()
+            entry = (rank(current, remaining[current]), arrival[current], pos, current)
+            if ready[0] < entry:
+                gantt.append((pids[current], start, time))
+                heapq.heappush(ready, entry)
+                current = None
+            continue
+
+        time = finish
+        remaining[current] = 0
+        gantt.append((pids[current], start, time))
+        turnaround[current] = time - arrival[current]
+        waiting[current] = turnaround[current] - burst[current]
+        current = None
+
+    return gantt, waiting, turnaround
+
+
+def srtf_engine(table):
+    return _preemptive_engine(table, lambda i, remaining: remaining)
+
+
+def preemptive_priority_engine(table):
+    priority = table.priority
+    return _preemptive_engine(table, lambda i, remaining: priority[i])
+
+
+MULTICORE_ENGINES = {
+    "FCFS": fcfs_engine,
+    "SJF": sjf_engine,
+    "Priority": priority_engine,
+    "Round Robin": rr_engine,
+}
+
+
+def multicore_engine(table, cores, algo="FCFS", quantum=2, dispatch="global"):
+    # Gantt entries carry the core as a fourth field: (pid, start, end, core).
+    # With dispatch="global" every core pulls from one shared ready queue; with
+    # dispatch="per-core" each process is bound on arrival to the core that will be
+    # free soonest and every core then runs the single-core algorithm on its share.
+    # Idle cores always come off a heap of next-free times.
+    if algo not in MULTICORE_ENGINES:
+        raise ValueError(f"{algo} has no multi-core mode.")
+    if cores <= 0:
+        raise ValueError("Number of cores must be positive.")
+    if dispatch == "per-core":
+        return _per_core_engine(table, cores, algo, quantum)
+    if dispatch != "global":
+        raise ValueError(f"Unknown dispatch mode: {dispatch}")
+    if algo == "Round Robin":
+        return _global_rr_engine(table, cores, quantum)
+
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    # Same int-keyed ready heap as _nonpreemptive_engine; FCFS has no primary key
+    primary = {"FCFS": array('q', bytes(8 * n)), "SJF": burst, "Priority": table.priority}[algo]
+    tie_order = _priority_tie_order(table) if algo == "Priority" else order
+    tie_rank = array('q', bytes(8 * n))
+    for pos, i in enumerate(tie_order):
+        tie_rank[i] = pos
+    waiting, turnaround = _new_metrics(n)
+    free = [(0, c) for c in range(cores)]
+    gantt, ready, nxt, time = [], [], 0, 0
+    while nxt < n or ready:
+        # Dispatch times never go backwards: a core that went idle earlier still
+        # cannot pick up work before the moment it became ready
+        free_at, core = heapq.heappop(free)
+        time = max(time, free_at)
+        if not ready and time < arrival[order[nxt]]:
+            time = arrival[order[nxt]]
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, primary[i] * n + tie_rank[i])
+            nxt += 1
+        i = tie_order[heapq.heappop(ready) % n]
+        start, finish = time, time + burst[i]
+        gantt.append((pids[i], start, finish, core))
+        heapq.heappush(free, (finish, core))
+        waiting[i] = start - arrival[i]
+        turnaround[i] = finish - arrival[i]
+    return gantt, waiting, turnaround
+
+
+def _global_rr_engine(table, cores, quantum):
+    # A preempted process only rejoins the shared queue once its slice has ended,
+    # so it waits in 'requeue' (keyed by that time) until some core reaches it.
+    pids, arrival, burst = table.pids, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    remaining = array('q', burst)
+    waiting, turnaround = _new_metrics(n)
+    free = [(0, c) for c in range(cores)]
+    gantt, ready, requeue, nxt, seq, time = [], deque(), [], 0, 0, 0
+
+    while nxt < n or ready or requeue:
+        free_at, core = heapq.heappop(free)
+        time = max(time, free_at)
+        if not ready:
+            upcoming = []
+            if nxt < n:
+                upcoming.append(arrival[order[nxt]])
+            if requeue:
+                upcoming.append(requeue[0][0])
+            time = max(time, min(upcoming))
+        # Merge arrivals and requeued processes in time order, arrivals first on ties
+        while True:
+            next_arrival = arrival[order[nxt]] if nxt < n else None
+            if next_arrival is not None and next_arrival <= time and (not requeue or next_arrival <= requeue[0][0]):
+                ready.append(order[nxt])
+                nxt += 1
+            elif requeue and requeue[0][0] <= time:
+                ready.append(heapq.heappop(requeue)[2])
+            else:
+                break
+
+        i = ready.popleft()
+        run_time = min(quantum, remaining[i])
+        start, end = time, time + run_time
+        remaining[i] -= run_time
+        gantt.append((pids[i], start, end, core))
+        heapq.heappush(free, (end, core))
+        if remaining[i] > 0:
+            heapq.heappush(requeue, (end, seq, i))
+            seq += 1
+        else:
+            turnaround[i] = end - arrival[i]
+            waiting[i] = turnaround[i] - burst[i]
+
+    return gantt, waiting, turnaround
+
+
+def _per_core_engine(table, cores, algo, quantum):
+    arrival, burst = table.arrival, table.burst
+    free = [(0, c) for c in range(cores)]
+    assigned = [[] for _ in range(cores)]
+    for i in table.arrival_order():
+        time, core = heapq.heappop(free)
+        assigned[core].append(i)
+        heapq.heappush(free, (max(time, arrival[i]) + burst[i], core))
+
+    waiting, turnaround = _new_metrics(len(table))
+    gantt = []
+    for core, rows in enumerate(assigned):
+        share = table.take(rows)
+        if algo == "Round Robin":
+            core_gantt, core_wait, core_turn = rr_engine(share, quantum)
+        else:
+            core_gantt, core_wait, core_turn = MULTICORE_ENGINES[algo](share)
+        gantt.extend((pid, start, end, core) for pid, start, end in core_gantt)
+        for local, row in enumerate(rows):
+            waiting[row] = core_wait[local]
+            turnaround[row] = core_turn[local]
+    gantt.sort(key=lambda entry: (entry[1], entry[3]))
+    return gantt, waiting, turnaround
+
+
+SCHEDULERS = ("FCFS", "SJF", "SRTF", "Priority", "Priority (Preemptive)", "Round Robin", "MLFQ")
+
+
+def run_scheduler(table, algo, quantum=2, boost=0, cores=1, dispatch="global"):
+    # One entry point for every engine, as used by the comparison runs. MLFQ
+    # levels double the RR quantum at each step down.
+    if cores > 1:
+        return multicore_engine(table, cores, algo, quantum, dispatch)
+    if algo == "FCFS":
+        return fcfs_engine(table)
+    if algo == "SJF":
+        return sjf_engine(table)
+    if algo == "SRTF":
+        return srtf_engine(table)
+    if algo == "Priority":
+        return priority_engine(table)
+    if algo == "Priority (Preemptive)":
+        return preemptive_priority_engine(table)
+    if algo == "Round Robin":
+        return rr_engine(table, quantum)
+    if algo == "MLFQ":
+        return mlfq_engine(table, (quantum, 2 * quantum, 4 * quantum), boost_interval=boost or None)
+    raise ValueError(f"Unknown scheduling algorithm: {algo}")
+
+
+# Worker-side view of the workload, attached once per process by the pool
+# initializer. The block is kept referenced for as long as the table's columns
+# point into it.
+_worker_block = _worker_table = None
+
+
+def _init_table_worker(name):
+    global _worker_block, _worker_table
+    _worker_block = shared_memory.SharedMemory(name=name)
+    _worker_table = ProcessTable.from_shared(_worker_block)
+
+
+def _scheduler_task(algo, quantum, boost, cores, dispatch):
+    return run_scheduler(_worker_table, algo, quantum, boost, cores, dispatch)
+
+
+# Below this many processes a worker pool starts up slower than the engines run
+PARALLEL_COMPARE_MIN = 20_000
+
+
+def rr_quantum_metrics(table, quantum):
+    # Response time is first dispatch minus arrival; a context switch is any
+    # dispatch of a different process than the one that ran last
+    gantt, waiting, turnaround = rr_engine(table, quantum)
+    n, index, arrival = len(table), table.index, table.arrival
+    response, switches, last = 0, 0, None
+    seen = set()
+    for pid, start, _ in gantt:
+        if pid != last:
+            switches += last is not None
+            last = pid
+        if pid not in seen:
+            seen.add(pid)
+            response += start - arrival[index[pid]]
+    return {"quantum": quantum,
+            "avg_waiting": sum(waiting) / n if n else 0.0,
+            "avg_turnaround": sum(turnaround) / n if n else 0.0,
+            "avg_response": response / n if n else 0.0,
+            "context_switches": switches}
+
+
+def _rr_sweep_task(quantum):
+    return rr_quantum_metrics(_worker_table, quantum)
+
+
+def rr_quantum_sweep(table, quanta, workers=None):
+    """Round Robin metrics for every quantum, in the order given.
+
+    The table is parsed once and shared by every run: in-process for small
+    sweeps, through one shared memory block across a process pool otherwise.
+    """
+    job = QuantumSweep(table, quanta, workers)
+    try:
+        results = dict(job)
+    finally:
+        job.close()
+    return [results[q] for q in job.quanta]
+
+
+def best_quantum(sweep, metric="avg_waiting"):
+    # Lowest value of 'metric'; ties go to the smaller quantum
+    return min(sweep, key=lambda entry: (entry[metric], entry["quantum"]))
+
+
+def parse_quanta(text):
+    # "1-10" is an inclusive range; "2,4,8" lists quanta explicitly
+    quanta = []
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        low, sep, high = part.partition('-')
+        if not low.isdigit() or (sep and not high.isdigit()):
+            raise ValueError(f"Invalid quantum range: {part}")
+        quanta.extend(range(int(low), int(high) + 1) if sep else [int(low)])
+    if not quanta or min(quanta) <= 0:
+        raise ValueError("Quanta must be positive.")
+    return sorted(set(quanta))
+
+
+class SchedulerComparison(JobBatch):
+    """Run several scheduling algorithms on one table, each as a separate job.
+
+    Big tables are copied once into shared memory and the algorithms run
+    concurrently in a process pool; small ones run here, one algorithm per
+    poll(). Polled or iterated like any JobBatch, with (algo, (gantt, waiting,
+    turnaround)) pairs as results. Call close() when done.
+    """
+
+    def __init__(self, table, algos, quantum=2, boost=0, cores=1, dispatch="global", workers=None):
+        self.table, self.options = table, (quantum, boost, cores, dispatch)
+        self.algos = list(algos)
+        self._start_shared(self.algos, len(table), workers)
+
+    def _start_shared(self, keys, size, workers):
+        # 'size' is the work the jobs share, to weigh against starting a pool
+        self.block = None
+        workers = pool_size(workers, len(keys))
+        if workers > 1 and size >= PARALLEL_COMPARE_MIN:
+            self.block = self.table.to_shared()
+            self._start(keys, workers, _init_table_worker, (self.block.name,))
+        else:
+            self._start(keys)
+
+    def _submit(self, algo):
+        return self.pool.submit(_scheduler_task, algo, *self.options)
+
+    def _run(self, algo):
+        return run_scheduler(self.table, algo, *self.options)
+
+    def _release(self):
+        if self.block is not None:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+
+class QuantumSweep(SchedulerComparison):
+    """Round Robin metrics for every quantum, each quantum a separate job.
+
+    Runs like SchedulerComparison, with (quantum, metrics) pairs as results;
+    big sweeps share the table with a process pool through shared memory.
+    """
+
+    def __init__(self, table, quanta, workers=None):
+        self.table, self.quanta = table, list(quanta)
+        if not self.quanta or min(self.quanta) <= 0:
+            raise ValueError("Quanta must be positive.")
+        self._start_shared(self.quanta, len(table) * len(self.quanta), workers)
+
+    def _submit(self, quantum):
+        return self.pool.submit(_rr_sweep_task, quantum)
+
+    def _run(self, quantum):
+        return rr_quantum_metrics(self.table, quantum)
+
+
+# Dict-based wrappers: take and return one dict per process, as the GUI always has
+
+def fcfs_scheduling(processes):
+    gantt, waiting, turnaround = fcfs_engine(ProcessTable.from_dicts(processes))
+    return gantt, _annotate(processes, waiting, turnaround)
+
+
+def sjf_scheduling(processes):
+    gantt, waiting, turnaround = sjf_engine(ProcessTable.from_dicts(processes))
+    return gantt, _annotate(processes, waiting, turnaround)
+
+
+def priority_scheduling(processes):
+    gantt, waiting, turnaround = priority_engine(ProcessTable.from_dicts(processes))
+    return gantt, _annotate(processes, waiting, turnaround)
+
+
+def round_robin(processes, quantum):
+    gantt, waiting, turnaround = rr_engine(ProcessTable.from_dicts(processes), quantum)
+    return gantt, _annotate(processes, waiting, turnaround, by_arrival=False)
+
+
+def mlfq_scheduling(processes, quanta=(2, 4, 8), allotments=None, boost_interval=None):
+    gantt, waiting, turnaround = mlfq_engine(ProcessTable.from_dicts(processes), quanta, allotments, boost_interval)
+    return gantt, _annotate(processes, waiting, turnaround, by_arrival=False)
+
+
+def srtf_scheduling(processes):
+    gantt, waiting, turnaround = srtf_engine(ProcessTable.from_dicts(processes))
+    return gantt, _annotate(processes, waiting, turnaround)
+
+
+def preemptive_priority_scheduling(processes):
+    gantt, waiting, turnaround = preemptive_priority_engine(ProcessTable.from_dicts(processes))
+    return gantt, _annotate(processes, waiting, turnaround)
+
+
+def multicore_scheduling(processes, cores, algo="FCFS", quantum=2, dispatch="global"):
+    gantt, waiting, turnaround = multicore_engine(ProcessTable.from_dicts(processes), cores, algo, quantum, dispatch)
+    return gantt, _annotate(processes, waiting, turnaround)
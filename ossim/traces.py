@@ -0,0 +1,112 @@
+import mmap
+import struct
+import sys
+from array import array
+from functools import partial
+
+
+def iter_references(chunks, block=1 << 16):
+    """Parse page numbers separated by commas or whitespace from text chunks.
+
+    Accepts a string, an open text file or any iterable of strings. A file is
+    read in blocks of 'block' characters rather than by line, so a one-line
+    trace streams too; no more than one chunk plus a partial number is held in
+    memory.
+    """
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    elif hasattr(chunks, "read"):
+        chunks = iter(partial(chunks.read, block), "")
+    tail = ""
+    for chunk in chunks:
+        text = (tail + chunk).replace(',', ' ')
+        tokens = text.split()
+        # A number running up to the end of the chunk may continue in the next one
+        tail = tokens.pop() if tokens and not text[-1].isspace() else ""
+        for token in tokens:
+            yield int(token)
+    if tail:
+        yield int(tail)
+
+
+# Binary trace files: a 16-byte little-endian header (magic, version, element
+# type 'I' for uint32 or 'Q' for uint64, two pad bytes, page size in bytes)
+# followed by packed page numbers
+TRACE_MAGIC = b"PGTR"
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct("<4sBc2xQ")
+
+
+class PageTrace:
+    """A binary page trace mapped read-only into memory.
+
+    'pages' is a memoryview over the mapping, so it supports len(), indexing and
+    iteration like a list and can be handed straight to the page replacement
+    functions without copying. Close the trace (or use it as a context manager)
+    when done; 'pages' cannot be read after that, though slices taken from it
+    stay valid and keep the file mapped until they are dropped.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fh:
+            header = fh.read(TRACE_HEADER.size)
+            if len(header) < TRACE_HEADER.size:
+                raise ValueError(f"{path} is too short to be a page trace.")
+            magic, version, typecode, self.page_size = TRACE_HEADER.unpack(header)
+            if magic != TRACE_MAGIC:
+                raise ValueError(f"{path} is not a page trace file.")
+            if version != TRACE_VERSION:
+                raise ValueError(f"Unsupported page trace version: {version}")
+            self.typecode = typecode.decode()
+            if self.typecode not in ("I", "Q"):
+                raise ValueError(f"Unsupported page trace element type: {self.typecode}")
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._body = memoryview(self._map)[TRACE_HEADER.size:]
+        if len(self._body) % struct.calcsize(self.typecode):
+            self.close()
+            raise ValueError(f"{path} ends in a partial page number.")
+        if sys.byteorder == "little":
+            self.pages = self._body.cast(self.typecode)
+        else:
+            # The file is little-endian, so big-endian hosts pay for one copy
+            self.pages = array(self.typecode, self._body)
+            self.pages.byteswap()
+
+    def __len__(self):
+        return len(self.pages)
+
+    def close(self):
+        if isinstance(getattr(self, "pages", None), memoryview):
+            self.pages.release()
+        self._body.release()
+        try:
+            self._map.close()
+        except BufferError:
+            # A slice of 'pages' is still alive; the mapping goes with the last one
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_trace(path, pages, typecode="I", page_size=4096, chunk=1 << 16):
+    """Write any iterable of page numbers as a binary trace file."""
+    if typecode not in ("I", "Q"):
+        raise ValueError(f"Unsupported page trace element type: {typecode}")
+    pages, written = iter(pages), 0
+    with open(path, "wb") as fh:
+        fh.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, typecode.encode(), page_size))
+        while True:
+            block = array(typecode, (page for _, page in zip(range(chunk), pages)))
+            if not block:
+                break
+            if sys.byteorder != "little":
+                block.byteswap()
+            block.tofile(fh)
+            written += len(block)
+    return written
@@ -0,0 +1,157 @@
+import random
+
+import pytest
+
+from ossim import (
+    FaultCurveSweep, PageTrace, arc_page_replacement, compare_policies, fifo_frame_sweep, lfu_page_replacement,
+    miss_ratio_curve, paging, two_queue_page_replacement, write_trace, zipf_references,
+)
+
+
+def random_traces(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        pages = rng.randint(2, 20)
+        yield rng.randint(1, 8), [rng.randrange(pages) for _ in range(rng.randint(1, 300))]
+
+
+def arc_reference(pages, c):
+    # Fault count of ARC(c) as written in Megiddo & Modha's pseudocode; lists are LRU first
+    t1, t2, b1, b2 = [], [], [], []
+    p, faults = 0.0, 0
+
+    def replace(in_b2):
+        if t1 and (len(t1) > p or (in_b2 and len(t1) == p)):
+            b1.append(t1.pop(0))
+        else:
+            b2.append(t2.pop(0))
+
+    for x in pages:
+        if x in t1 or x in t2:
+            (t1 if x in t1 else t2).remove(x)
+            t2.append(x)
+            continue
+        faults += 1
+        if x in b1:
+            p = min(c, p + max(len(b2) / len(b1), 1))
+            replace(False)
+            b1.remove(x)
+            t2.append(x)
+        elif x in b2:
+            p = max(0, p - max(len(b1) / len(b2), 1))
+            replace(True)
+            b2.remove(x)
+            t2.append(x)
+        else:
+            if len(t1) + len(b1) == c:
+                if len(t1) < c:
+                    b1.pop(0)
+                    replace(False)
+                else:
+                    t1.pop(0)
+            elif len(t1) + len(t2) + len(b1) + len(b2) >= c:
+                if len(t1) + len(t2) + len(b1) + len(b2) == 2 * c:
+                    b2.pop(0)
+                replace(False)
+            t1.append(x)
+    return faults
+
+
+
+def two_queue_reference(pages, c):
+    # Fault count of Johnson & Shasha's full 2Q with Kin = c / 4 and Kout = c / 2;
+    # lists are oldest first
+    k_in, k_out = max(1, c // 4), max(1, c // 2)
+    a1in, a1out, am, faults = [], [], [], 0
+
+    def reclaim():
+        if len(a1in) + len(am) < c:
+            return
+        if len(a1in) > k_in or not am:
+            a1out.append(a1in.pop(0))
+            if len(a1out) > k_out:
+                a1out.pop(0)
+        else:
+            am.pop(0)
+
+    for x in pages:
+        if x in am:
+            am.remove(x)
+            am.append(x)
+        elif x in a1in:
+            continue
+        elif x in a1out:
+            faults += 1
+            reclaim()
+            if x in a1out:
+                a1out.remove(x)
+            am.append(x)
+        else:
+            faults += 1
+            reclaim()
+            a1in.append(x)
+    return faults
+
+
+def lfu_reference(pages, c):
+    # Evict the page with the fewest references since it was loaded, the least
+    # recently used among equals
+    count, last, faults = {}, {}, 0
+    for t, x in enumerate(pages):
+        if x not in count:
+            faults += 1
+            if len(count) == c:
+                victim = min(count, key=lambda p: (count[p], last[p]))
+                del count[victim]
+            count[x] = 0
+        count[x] += 1
+        last[x] = t
+    return faults
+
+def test_worker_pools_accept_a_mapped_trace(tmp_path, monkeypatch):
+    pages = list(zipf_references(3000, 80, seed=7))
+    path = str(tmp_path / "trace.bin")
+    write_trace(path, pages)
+    # Send even this small trace through the worker pools
+    monkeypatch.setattr(paging, "SWEEP_PARALLEL_MIN", 0)
+    monkeypatch.setattr(paging, "COMPARE_PARALLEL_MIN", 0)
+
+    with PageTrace(path) as trace:
+        assert list(fifo_frame_sweep(trace.pages, 24, workers=2)) == list(fifo_frame_sweep(pages, 24, workers=1))
+        assert compare_policies(trace.pages, 16, workers=2) == compare_policies(pages, 16, workers=1)
+        # Handed the trace itself, the workers reopen it by path
+        assert list(fifo_frame_sweep(trace, 24, workers=2)) == list(fifo_frame_sweep(pages, 24, workers=1))
+        assert compare_policies(trace, 16, workers=2) == compare_policies(pages, 16, workers=1)
+
+
+@pytest.mark.parametrize("page_count", [40, 8])
+def test_fault_curve_sweep_matches_the_batch_curves(monkeypatch, page_count):
+    pages = list(zipf_references(2000, page_count, seed=3))
+    # LRU runs to the number of distinct pages; FIFO and Optimal stop at 12 or there
+    frames = min(12, len(set(pages)))
+    expected = {"FIFO": list(fifo_frame_sweep(pages, frames, workers=1)),
+                "LRU": miss_ratio_curve(pages, "LRU"), "Optimal": miss_ratio_curve(pages, "Optimal", frames)}
+    monkeypatch.setattr(paging, "SWEEP_PARALLEL_MIN", 0)
+    for workers in (1, 2):
+        job = FaultCurveSweep(pages, 12, workers=workers)
+        try:
+            while not job.done():
+                job.poll()
+        finally:
+            job.close()
+        assert {algo: list(curve) for algo, curve in job.curves.items()} == expected
+
+
+def test_arc_matches_the_papers_pseudocode():
+    for frames, pages in random_traces(300, seed=5):
+        assert arc_page_replacement(pages, frames, record="none")[0] == arc_reference(pages, frames)
+
+
+def test_two_queue_matches_the_papers_pseudocode():
+    for frames, pages in random_traces(300, seed=6):
+        assert two_queue_page_replacement(pages, frames, record="none")[0] == two_queue_reference(pages, frames)
+
+
+def test_lfu_matches_reference_model():
+    for frames, pages in random_traces(300, seed=7):
+        assert lfu_page_replacement(pages, frames, record="none")[0] == lfu_reference(pages, frames)
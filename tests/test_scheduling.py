@@ -0,0 +1,197 @@
+import random
+
+import pytest
+
+from ossim import (
+    ProcessTable, mlfq_engine, multicore_engine, parse_workload, preemptive_priority_engine, rr_engine,
+    srtf_engine,
+)
+
+# The reference models below advance the clock one time unit at a time and
+# return (waiting, turnaround) by row, which every engine must match exactly
+
+
+def random_tables(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 8)
+        yield ProcessTable([f"P{k}" for k in rng.sample(range(1, 20), n)],
+                           [rng.randint(0, 15) for _ in range(n)],
+                           [rng.randint(1, 8) for _ in range(n)],
+                           [rng.randint(1, 3) for _ in range(n)])
+
+
+def metrics(table, finish):
+    turnaround = [finish[i] - table.arrival[i] for i in range(len(table))]
+    return [t - b for t, b in zip(turnaround, table.burst)], turnaround
+
+
+def engine_metrics(result):
+    _, waiting, turnaround = result
+    return list(waiting), list(turnaround)
+
+
+def preemptive_reference(table, rank):
+    # Each unit goes to the arrived process with the lowest (rank, arrival, arrival position)
+    position = {i: pos for pos, i in enumerate(table.arrival_order())}
+    remaining, finish, time = list(table.burst), {}, 0
+    while len(finish) < len(table):
+        ready = [i for i in range(len(table)) if table.arrival[i] <= time and i not in finish]
+        if ready:
+            i = min(ready, key=lambda i: (rank(i, remaining[i]), table.arrival[i], position[i]))
+            remaining[i] -= 1
+            if not remaining[i]:
+                finish[i] = time + 1
+        time += 1
+    return metrics(table, finish)
+
+
+def mlfq_reference(table, quanta, allotments):
+    # Arrivals join level 0; a slice ends on completion, after the level's quantum,
+    # when the level's allotment is used up (demoting the process) or, below
+    # level 0, when a new process arrives. Arrivals queue ahead of the process
+    # whose slice ends at the same moment.
+    order = list(table.arrival_order())
+    queues = [[] for _ in quanta]
+    remaining, used, level, finish = list(table.burst), [0] * len(table), [0] * len(table), {}
+    time, current = 0, None
+
+    def admit():
+        while order and table.arrival[order[0]] <= time:
+            queues[0].append(order.pop(0))
+
+    admit()
+    while len(finish) < len(table):
+        if current is None:
+            if not any(queues):
+                time = table.arrival[order[0]]
+                admit()
+            current = next(q for q in queues if q).pop(0)
+            ran = 0
+        i, lvl = current, level[current]
+        remaining[i], used[i], ran, time = remaining[i] - 1, used[i] + 1, ran + 1, time + 1
+        arrived = bool(order) and table.arrival[order[0]] <= time
+        admit()
+        if not remaining[i]:
+            finish[i], current = time, None
+        elif ran == quanta[lvl] or used[i] == allotments[lvl] or (lvl and arrived):
+            if used[i] == allotments[lvl]:
+                level[i], used[i] = min(lvl + 1, len(quanta) - 1), 0
+            queues[level[i]].append(i)
+            current = None
+    return metrics(table, finish)
+
+
+def global_reference(table, cores, key):
+    # Idle cores take the ready process with the lowest key and run it to completion
+    ready, busy, finish, time = [], {}, {}, 0
+    waiting = sorted(range(len(table)), key=table.arrival.__getitem__)
+    while len(finish) < len(table):
+        ready += [i for i in waiting if table.arrival[i] == time]
+        for core in range(cores):
+            if busy.get(core, (None, 0))[1] <= time and ready:
+                i = min(ready, key=key)
+                ready.remove(i)
+                busy[core] = (i, time + table.burst[i])
+                finish[i] = time + table.burst[i]
+        time += 1
+    return metrics(table, finish)
+
+
+def global_rr_reference(table, cores, quantum):
+    # One shared queue; a preempted process rejoins it when its slice ends, after
+    # processes arriving at that moment and after earlier-dispatched processes
+    order = list(table.arrival_order())
+    remaining, finish, queue, running, time = list(table.burst), {}, [], [], 0
+    while len(finish) < len(table):
+        while order and table.arrival[order[0]] <= time:
+            queue.append(order.pop(0))
+        for entry in [entry for entry in running if entry[0] == time]:
+            running.remove(entry)
+            if remaining[entry[1]]:
+                queue.append(entry[1])
+            else:
+                finish[entry[1]] = time
+        while queue and len(running) < cores:
+            i = queue.pop(0)
+            run = min(quantum, remaining[i])
+            remaining[i] -= run
+            running.append((time + run, i))
+        time += 1
+    return metrics(table, finish)
+
+
+def sjf_key(table):
+    position = {i: pos for pos, i in enumerate(table.arrival_order())}
+    return lambda i: (table.burst[i], position[i])
+
+
+def per_core_sjf_reference(table, cores):
+    # Each process is bound on arrival to the core expected to be free soonest,
+    # and every core then runs SJF over its own processes
+    expected, rows = [0] * cores, [[] for _ in range(cores)]
+    for i in table.arrival_order():
+        core = min(range(cores), key=lambda c: (expected[c], c))
+        expected[core] = max(expected[core], table.arrival[i]) + table.burst[i]
+        rows[core].append(i)
+    waiting, turnaround = [0] * len(table), [0] * len(table)
+    for share_rows in rows:
+        share = table.take(share_rows)
+        for row, wait, turn in zip(share_rows, *global_reference(share, 1, sjf_key(share))):
+            waiting[row], turnaround[row] = wait, turn
+    return waiting, turnaround
+
+
+def test_srtf_matches_unit_step_model():
+    for table in random_tables(300, seed=1):
+        assert engine_metrics(srtf_engine(table)) == preemptive_reference(table, lambda i, left: left)
+
+
+def test_preemptive_priority_matches_unit_step_model():
+    for table in random_tables(300, seed=2):
+        expected = preemptive_reference(table, lambda i, left: table.priority[i])
+        assert engine_metrics(preemptive_priority_engine(table)) == expected
+
+
+@pytest.mark.parametrize("quanta, allotments", [((2, 4, 8), None), ((1, 2), (3, 4)), ((3,), None)])
+def test_mlfq_matches_unit_step_model(quanta, allotments):
+    for table in random_tables(300, seed=3):
+        expected = mlfq_reference(table, quanta, allotments or quanta)
+        assert engine_metrics(mlfq_engine(table, quanta, allotments)) == expected
+
+
+def test_single_level_mlfq_with_boosts_is_round_robin():
+    for table in random_tables(200, seed=4):
+        for boost in (1, 3, 7):
+            boosted = mlfq_engine(table, (2,), boost_interval=boost)
+            assert engine_metrics(boosted) == engine_metrics(rr_engine(table, 2))
+
+
+def test_mlfq_rejects_a_negative_boost_interval():
+    with pytest.raises(ValueError):
+        mlfq_engine(parse_workload(["P1 0 5"]), boost_interval=-5)
+
+
+@pytest.mark.parametrize("cores", [1, 2, 3])
+def test_global_dispatch_matches_unit_step_model(cores):
+    for table in random_tables(200, seed=5):
+        position = {i: pos for pos, i in enumerate(table.arrival_order())}
+        keys = {"FCFS": lambda i: position[i], "SJF": sjf_key(table),
+                "Priority": lambda i: (table.priority[i], table.arrival[i], table.pids[i])}
+        for algo, key in keys.items():
+            assert engine_metrics(multicore_engine(table, cores, algo)) == global_reference(table, cores, key)
+        result = multicore_engine(table, cores, "Round Robin", 2)
+        assert engine_metrics(result) == global_rr_reference(table, cores, 2)
+
+
+@pytest.mark.parametrize("cores", [1, 2, 3])
+def test_per_core_dispatch_matches_unit_step_model(cores):
+    for table in random_tables(200, seed=6):
+        result = multicore_engine(table, cores, "SJF", dispatch="per-core")
+        assert engine_metrics(result) == per_core_sjf_reference(table, cores)
+
+
+def test_parse_workload_rejects_impossible_processes():
+    for line in ("P1 -1 5", "P1 0 0", "P1 0 -3"):
+        with pytest.raises(ValueError):
+            parse_workload([line])
@@ -0,0 +1,12 @@
+import io
+
+from ossim import iter_references
+
+
+def test_iter_references_reads_files_in_blocks():
+    text = "12, 7,3\n41 ,5,, 600\n8"
+    expected = [12, 7, 3, 41, 5, 600, 8]
+    assert list(iter_references(text)) == expected
+    # Blocks this small split numbers and separators between reads
+    for block in (1, 2, 3, 5):
+        assert list(iter_references(io.StringIO(text), block)) == expected